@@ -1,9 +1,9 @@
 from dataclasses import dataclass
-from typing import Tuple
+from typing import ClassVar, Tuple
 import math
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class CelestialBody():
     """Base class for all celestial bodies in the solar system simulation."""
     name: str
@@ -14,6 +14,8 @@ class CelestialBody():
     x_velocity: float = 0.0
     y_velocity: float = 0.0
     color: Tuple[int, int, int] = (255, 255, 255)  # RGB color for rendering
+    immovable: bool = False  # Survives collisions unless hit by something 10x more massive
+    is_satellite: ClassVar[bool] = False  # Small craft, checked for collisions by the sweep
 
     def get_position(self) -> Tuple[float, float]:
         """Get the current position as a tuple."""
@@ -37,7 +39,13 @@ class CelestialBody():
         """Calculate the distance to another celestial body."""
         dx = self.x_position - other.x_position
         dy = self.y_position - other.y_position
-        return math.sqrt(dx**2 + dy**2)
+        return math.sqrt(dx * dx + dy * dy)
+
+    def distance_squared_to(self, other: 'CelestialBody') -> float:
+        """Calculate the squared distance to another celestial body (no square root)."""
+        dx = self.x_position - other.x_position
+        dy = self.y_position - other.y_position
+        return dx * dx + dy * dy
 
     def update(self, dt: float) -> None:
         """Update CustomBody's position based on its velocity."""
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Tuple
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class ImpactMarker:
     """Represents an impact site where a satellite collided with a celestial body."""
     x_position: float
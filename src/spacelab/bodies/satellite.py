@@ -1,11 +1,22 @@
-from typing import Tuple
+from typing import ClassVar, Tuple
 from dataclasses import dataclass
 from .celestial_body import CelestialBody
 
+# Defaults for a newly launched satellite
+SATELLITE_RADIUS_KM = 0.1  # Small satellite
+SATELLITE_MASS_KG = 1000.0  # 1 ton satellite
+SATELLITE_COLOR = (0, 255, 255)  # Cyan color
 
-@dataclass
+
+@dataclass(slots=True, eq=False, repr=False)
 class Satellite(CelestialBody):
     """Artificial satellite that can orbit around other celestial bodies."""
-    radius_km: float = 0.1  # Small satellite
-    mass_kg: float = 1000.0  # 1 ton satellite
-    color: Tuple[int, int, int] = (0, 255, 255)  # Cyan color
\ No newline at end of file
+    radius_km: float = SATELLITE_RADIUS_KM
+    mass_kg: float = SATELLITE_MASS_KG
+    color: Tuple[int, int, int] = SATELLITE_COLOR
+    is_satellite: ClassVar[bool] = True
+
+    @classmethod
+    def from_state(cls, name: str, x: float, y: float, vx: float = 0.0, vy: float = 0.0) -> 'Satellite':
+        """Create a default satellite at a position and velocity, passing every field positionally."""
+        return cls(name, SATELLITE_RADIUS_KM, SATELLITE_MASS_KG, x, y, vx, vy, SATELLITE_COLOR)
@@ -9,6 +9,8 @@ FPS = 60
 # Simulation settings
 TIME_SCALE = 10.0  # Speed up simulation (10x real time)
 PHYSICS_DT = 1.0  # Physics time step in seconds
+PHYSICS_UPDATE_RATE = FPS  # Physics updates per real second, independent of the frame rate
+MAX_FRAME_TIME = 0.25  # Most real time (s) the physics catches up on after a slow frame
 
 # Physics Integration Method
 # Choose between two integration methods:
@@ -18,6 +20,18 @@ PHYSICS_DT = 1.0  # Physics time step in seconds
 # Note: "patched_conic" is not yet implemented, so it will raise NotImplemented
 PHYSICS_INTEGRATION_METHOD = "multi_step"  # Options: "single_step" or "multi_step"
 MAX_PHYSICS_STEPS_PER_FRAME = 100  # Maximum physics steps per frame (for multi_step method)
+# Store body state as float64; False stores masses as float32, trimming memory traffic
+# slightly. Positions and velocities are always float64
+HIGH_PRECISION_MODE = True
+
+# Barnes-Hut gravity (used instead of the direct sum when Numba is installed)
+BARNES_HUT_MIN_BODIES = 1000  # Switch to the quadtree at or above this many bodies
+BARNES_HUT_THETA = 0.5  # Opening angle: larger is faster but less accurate
+PARALLEL_GRAVITY_MIN_BODIES = 64  # Spread the direct sum across threads at or above this many bodies
+GPU_GRAVITY_MIN_BODIES = 256  # Run the direct sum on a CUDA GPU, when one is available, at or above this many bodies
+
+# Collision detection
+COLLISION_GRID_MIN_BODIES = 200  # Use the spatial grid broad phase at or above this many non-satellite bodies
 
 # Rendering settings
 SCALE_FACTOR = .001  # Scale factor for converting km to pixels
@@ -40,10 +54,14 @@ TRAIL_COLOR = (100, 100, 100)   # Dark gray
 # Visualization
 SHOW_TRAILS = True
 TRAIL_LENGTH = 10000  # Number of points in trail (0 = unlimited)
+TRAIL_REDRAW_SLACK = 0.01  # Fraction of TRAIL_LENGTH a full trail may overrun by before it is trimmed on screen
 MIN_RENDER_RADIUS = 2  # Minimum pixel radius for bodies
+BODY_SPRITE_MAX_RADIUS = 64  # Bodies up to this pixel radius are drawn from cached sprites
+MAX_IMPACT_MARKERS = 256  # Oldest impact markers are dropped beyond this many
 
 # Starfield
 STAR_COUNT = 200  # Number of background stars
+MAX_STAR_COUNT = 20000  # Upper bound on STAR_COUNT, keeping starfield rebuilds on resize quick
 STAR_COLORS = [
     (255, 255, 255),  # White
     (255, 255, 200),  # Warm white
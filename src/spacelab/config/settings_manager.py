@@ -4,6 +4,36 @@ import json
 import os
 from typing import Dict, Any, Optional
 
+# orjson is an optional dependency; it parses and encodes several times faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(data: bytes) -> Any:
+    """Decode JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(value: Any) -> bytes:
+    """Encode JSON indented by two spaces, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2)
+    return json.dumps(value, indent=2).encode()
+
+
+def _matches_type(value: Any, default: Any) -> bool:
+    """Whether a loaded value has the type of a setting's default (an int may stand for a float)."""
+    # bool is a subclass of int, so a flag and a number must never stand in for each other
+    if isinstance(value, bool) or isinstance(default, bool):
+        return type(value) is type(default)
+    if isinstance(default, float):
+        return isinstance(value, (int, float))
+    return isinstance(value, type(default))
+
 
 class SettingsManager:
     """Manages user settings with save/load functionality."""
@@ -44,32 +74,64 @@ class SettingsManager:
             "collision_detection": True
         }
 
-        # Current settings (loaded from file or defaults)
-        self.settings = self.default_settings.copy()
-        self.load_settings()
+        # Current settings (loaded from file or defaults); None until they are first needed
+        self._settings = None
+        # Settings as last read from or written to the file; None until the file has been seen
+        self._saved_settings = None
+        # Whether settings changed since the last load or save
+        self._dirty = False
+
+    @property
+    def settings(self) -> Dict[str, Any]:
+        """Current settings, read from the file the first time they are accessed."""
+        if self._settings is None:
+            self.load_settings()
+        return self._settings
+
+    @settings.setter
+    def settings(self, value: Dict[str, Any]) -> None:
+        self._settings = value
 
     def load_settings(self) -> None:
         """Load settings from file."""
+        if self._settings is None:
+            self._settings = self.default_settings.copy()
         try:
-            if os.path.exists(self.settings_file):
-                with open(self.settings_file, 'r') as f:
-                    loaded_settings = json.load(f)
-                    # Only update settings that exist in defaults (for safety)
-                    for key, value in loaded_settings.items():
-                        if key in self.default_settings:
-                            self.settings[key] = value
-                print(f"Settings loaded from {self.settings_file}")
-            else:
-                print("No settings file found, using defaults")
+            # Opening the file directly saves a separate existence check on slow filesystems
+            with open(self.settings_file, 'rb') as f:
+                loaded_settings = _loads(f.read())
+            # Only update settings that exist in defaults, with a value of the same type (for safety)
+            defaults = self.default_settings
+            valid_settings = {key: value for key, value in loaded_settings.items()
+                              if key in defaults and _matches_type(value, defaults[key])}
+            rejected = [key for key in loaded_settings.keys() & defaults.keys() if key not in valid_settings]
+            if rejected:
+                print(f"Ignoring settings with invalid values: {', '.join(sorted(rejected))}")
+            self._settings.update(valid_settings)
+            self._saved_settings = self._settings.copy()
+            print(f"Settings loaded from {self.settings_file}")
+        except FileNotFoundError:
+            print("No settings file found, using defaults")
         except Exception as e:
             print(f"Error loading settings: {e}")
-            self.settings = self.default_settings.copy()
+            self._settings = self.default_settings.copy()
 
     def save_settings(self) -> None:
         """Save current settings to file."""
+        # A failed write is not retried until a setting changes again, so an unwritable
+        # file (such as one inside a read-only installed package) is reported only once
+        self._dirty = False
+        # Nothing to write if the file already holds these settings
+        if self.settings == self._saved_settings:
+            return
         try:
-            with open(self.settings_file, 'w') as f:
-                json.dump(self.settings, f, indent=2)
+            # Write a temporary file and rename it over the old one, so a crash mid-write
+            # can never leave a truncated settings file behind
+            temp_file = self.settings_file + ".tmp"
+            with open(temp_file, 'wb') as f:
+                f.write(_dumps(self.settings))
+            os.replace(temp_file, self.settings_file)
+            self._saved_settings = self.settings.copy()
             print(f"Settings saved to {self.settings_file}")
         except Exception as e:
             print(f"Error saving settings: {e}")
@@ -81,15 +143,24 @@ class SettingsManager:
     def set(self, key: str, value: Any) -> None:
         """Set a setting value."""
         if key in self.default_settings:
-            self.settings[key] = value
+            if self.settings[key] != value:
+                self.settings[key] = value
+                self._dirty = True
         else:
             print(f"Warning: Unknown setting key '{key}'")
 
     def reset_to_defaults(self) -> None:
         """Reset all settings to defaults."""
-        self.settings = self.default_settings.copy()
+        if self.settings != self.default_settings:
+            self.settings = self.default_settings.copy()
+            self._dirty = True
         print("Settings reset to defaults")
 
+    def flush(self) -> None:
+        """Save the settings if they changed since they were last loaded or saved."""
+        if self._dirty:
+            self.save_settings()
+
     def get_all_settings(self) -> Dict[str, Any]:
         """Get all current settings."""
         return self.settings.copy()
@@ -0,0 +1,71 @@
+"""Compiled numeric kernels for the per-frame body drawing pass.
+
+Numba is an optional dependency. When it is installed the kernels are
+JIT-compiled to native loops; otherwise equivalent NumPy implementations
+are used so the renderer draws the same pixels either way.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+JIT_AVAILABLE = njit is not None
+
+# Value NumPy gives when casting a float that does not fit in int32 (or is NaN) to int32
+_INT32_INVALID = -2147483648
+
+
+if njit is not None:
+
+    @njit(fastmath=True, cache=True)
+    def _to_pixel(value):
+        """Truncate a screen coordinate toward zero, as the NumPy int32 cast does."""
+        if -2147483648.0 <= value < 2147483648.0:
+            return int(value)
+        return _INT32_INVALID
+
+    @njit(fastmath=True, cache=True)
+    def compute_body_draws(xs, ys, radii_km, scale, center_x, center_y, camera_x, camera_y,
+                           width, height, min_radius):
+        """Project, size and cull every body in one pass.
+
+        Returns the (N, 2) int32 screen positions, the int64 pixel radii and a
+        mask of the bodies whose disc (and its outline) reaches the screen.
+        """
+        n = xs.shape[0]
+        positions = np.empty((n, 2), dtype=np.int32)
+        radii = np.empty(n, dtype=np.int64)
+        on_screen = np.empty(n, dtype=np.bool_)
+        for i in range(n):
+            x = _to_pixel(center_x + (xs[i] - camera_x) * scale)
+            y = _to_pixel(center_y - (ys[i] - camera_y) * scale)  # Flip Y axis
+            radius = max(int(radii_km[i] * scale), min_radius)
+            positions[i, 0] = x
+            positions[i, 1] = y
+            radii[i] = radius
+            reach = radius + 1
+            on_screen[i] = x + reach >= 0 and x - reach < width and y + reach >= 0 and y - reach < height
+        return positions, radii, on_screen
+
+else:
+
+    def compute_body_draws(xs, ys, radii_km, scale, center_x, center_y, camera_x, camera_y,
+                           width, height, min_radius):
+        """Project, size and cull every body in one pass.
+
+        Returns the (N, 2) int32 screen positions, the int64 pixel radii and a
+        mask of the bodies whose disc (and its outline) reaches the screen.
+        """
+        positions = np.empty((len(xs), 2), dtype=np.int32)
+        # Assigning into the int32 array truncates toward zero, matching int() in world_to_screen
+        positions[:, 0] = center_x + (xs - camera_x) * scale
+        positions[:, 1] = center_y - (ys - camera_y) * scale  # Flip Y axis
+        radii = np.maximum((radii_km * scale).astype(np.int64), min_radius)
+
+        reach = radii + 1
+        on_screen = ((positions[:, 0] + reach >= 0) & (positions[:, 0] - reach < width) &
+                     (positions[:, 1] + reach >= 0) & (positions[:, 1] - reach < height))
+        return positions, radii, on_screen
@@ -2,7 +2,42 @@
 
 import pygame
 import os
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
+
+# Fonts by point size, loaded on first use and shared by every dialog opened afterwards
+_FONT_CACHE: Dict[int, pygame.font.Font] = {}
+
+
+def _get_font(size: int) -> pygame.font.Font:
+    """Return the dialog font at the given size, loading it only the first time."""
+    font = _FONT_CACHE.get(size)
+    if font is None:
+        font = _FONT_CACHE[size] = _load_custom_font(size)
+    return font
+
+
+def _load_custom_font(size: int) -> pygame.font.Font:
+    """Load custom font, fall back to system font if not available."""
+    try:
+        # Get the path to the fonts directory
+        current_dir = os.path.dirname(os.path.abspath(__file__))
+        fonts_dir = os.path.join(current_dir, "fonts")
+
+        # Look for Red Alert font files
+        red_alert_inet_path = os.path.join(fonts_dir, "C&C Red Alert [INET].ttf")
+        red_alert_lan_path = os.path.join(fonts_dir, "C&C Red Alert [LAN].ttf")
+
+        # Load the INET version as primary, LAN as backup
+        if os.path.exists(red_alert_inet_path):
+            return pygame.font.Font(red_alert_inet_path, size)
+        elif os.path.exists(red_alert_lan_path):
+            return pygame.font.Font(red_alert_lan_path, size)
+        else:
+            return pygame.font.Font(None, size)
+
+    except Exception:
+        # Fallback to system font
+        return pygame.font.Font(None, size)
 
 
 class InputDialog:
@@ -13,7 +48,7 @@ class InputDialog:
         self.title = title
         self.prompt = prompt
         self.input_text = default_value
-        self.font = self._load_custom_font()
+        self.font = _get_font(24)
         self.active = True
         self.result = None
 
@@ -30,28 +65,41 @@ class InputDialog:
         self.input_bg_color = (30, 30, 30)
         self.input_border_color = (100, 100, 100)
 
-    def _load_custom_font(self) -> pygame.font.Font:
-        """Load custom font, fall back to system font if not available."""
-        try:
-            # Get the path to the fonts directory
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            fonts_dir = os.path.join(current_dir, "fonts")
-
-            # Look for Red Alert font files
-            red_alert_inet_path = os.path.join(fonts_dir, "C&C Red Alert [INET].ttf")
-            red_alert_lan_path = os.path.join(fonts_dir, "C&C Red Alert [LAN].ttf")
-
-            # Load the INET version as primary, LAN as backup
-            if os.path.exists(red_alert_inet_path):
-                return pygame.font.Font(red_alert_inet_path, 24)
-            elif os.path.exists(red_alert_lan_path):
-                return pygame.font.Font(red_alert_lan_path, 24)
-            else:
-                return pygame.font.Font(None, 24)
+        # Input box, relative to the dialog
+        self.input_rect = pygame.Rect(20, 90, self.width - 40, 30)
 
-        except Exception:
-            # Fallback to system font
-            return pygame.font.Font(None, 24)
+        # Everything except the typed text and cursor never changes, so render it once
+        self._chrome = self._build_chrome()
+        self._input_surface = None
+        self._rendered_text = None
+
+    def _build_chrome(self) -> pygame.Surface:
+        """Render the static parts of the dialog: background, border, title, prompt, input box and instructions."""
+        chrome = pygame.Surface((self.width, self.height))
+
+        # Draw background
+        chrome.fill(self.bg_color)
+        pygame.draw.rect(chrome, self.border_color, chrome.get_rect(), 2)
+
+        # Draw title
+        title_surface = self.font.render(self.title, True, self.text_color)
+        title_x = (self.width - title_surface.get_width()) // 2
+        chrome.blit(title_surface, (title_x, 20))
+
+        # Draw prompt
+        prompt_surface = self.font.render(self.prompt, True, self.text_color)
+        chrome.blit(prompt_surface, (20, 60))
+
+        # Draw input box
+        pygame.draw.rect(chrome, self.input_bg_color, self.input_rect)
+        pygame.draw.rect(chrome, self.input_border_color, self.input_rect, 1)
+
+        # Draw instructions
+        inst_surface = self.font.render("Press ENTER to confirm, ESC to cancel", True, self.text_color)
+        inst_x = (self.width - inst_surface.get_width()) // 2
+        chrome.blit(inst_surface, (inst_x, 140))
+
+        return chrome.convert()
 
     def handle_event(self, event) -> bool:
         """Handle pygame events. Returns True if dialog should continue."""
@@ -78,42 +126,24 @@ class InputDialog:
 
     def draw(self):
         """Draw the input dialog."""
-        # Draw background
-        dialog_rect = pygame.Rect(self.x, self.y, self.width, self.height)
-        pygame.draw.rect(self.screen, self.bg_color, dialog_rect)
-        pygame.draw.rect(self.screen, self.border_color, dialog_rect, 2)
-
-        # Draw title
-        title_surface = self.font.render(self.title, True, self.text_color)
-        title_x = self.x + (self.width - title_surface.get_width()) // 2
-        self.screen.blit(title_surface, (title_x, self.y + 20))
-
-        # Draw prompt
-        prompt_surface = self.font.render(self.prompt, True, self.text_color)
-        prompt_x = self.x + 20
-        self.screen.blit(prompt_surface, (prompt_x, self.y + 60))
+        self.screen.blit(self._chrome, (self.x, self.y))
 
-        # Draw input box
-        input_rect = pygame.Rect(self.x + 20, self.y + 90, self.width - 40, 30)
-        pygame.draw.rect(self.screen, self.input_bg_color, input_rect)
-        pygame.draw.rect(self.screen, self.input_border_color, input_rect, 1)
+        # Re-render the input text only when it has changed
+        if self.input_text != self._rendered_text:
+            self._input_surface = self.font.render(self.input_text, True, self.text_color)
+            self._rendered_text = self.input_text
 
         # Draw input text
-        input_surface = self.font.render(self.input_text, True, self.text_color)
-        self.screen.blit(input_surface, (input_rect.x + 5, input_rect.y + 5))
+        text_x = self.x + self.input_rect.x + 5
+        text_y = self.y + self.input_rect.y + 5
+        self.screen.blit(self._input_surface, (text_x, text_y))
 
         # Draw cursor
-        cursor_x = input_rect.x + 5 + input_surface.get_width()
+        cursor_x = text_x + self._input_surface.get_width()
         if pygame.time.get_ticks() % 1000 < 500:  # Blink cursor
             pygame.draw.line(self.screen, self.text_color,
-                           (cursor_x, input_rect.y + 5),
-                           (cursor_x, input_rect.y + 25), 1)
-
-        # Draw instructions
-        instructions = ["Press ENTER to confirm, ESC to cancel"]
-        inst_surface = self.font.render(instructions[0], True, self.text_color)
-        inst_x = self.x + (self.width - inst_surface.get_width()) // 2
-        self.screen.blit(inst_surface, (inst_x, self.y + 140))
+                           (cursor_x, text_y),
+                           (cursor_x, text_y + 20), 1)
 
 
 def get_text_input(screen, title: str, prompt: str, default_value: str = "") -> Optional[str]:
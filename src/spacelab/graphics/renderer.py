@@ -1,12 +1,30 @@
 """Pygame rendering system for the solar system simulation."""
 
+import math
 import pygame
-import random
+import numpy as np
 import os
-from typing import List, Tuple
+from collections import defaultdict
+from itertools import compress
+from typing import List, Sequence, Tuple
 from ..bodies.celestial_body import CelestialBody
 from ..config import settings
 from ..config.settings import *
+from ._kernels import compute_body_draws
+from .trail_buffer import TrailBuffer
+
+# Rotation by the angle (radians) between a velocity arrow's shaft and each side of its head
+_ARROWHEAD_ANGLE = 0.5
+_AH_C = math.cos(_ARROWHEAD_ANGLE)
+_AH_S = math.sin(_ARROWHEAD_ANGLE)
+_hypot = math.hypot
+
+# Pixel offsets, from the star's position, that pygame.draw.circle fills for each star radius
+_STAR_FOOTPRINTS = {
+    1: ((-1, -1), (0, -1), (-1, 0), (0, 0)),
+    2: ((-2, -1), (-2, 0), (-1, -2), (-1, -1), (-1, 0), (-1, 1),
+        (0, -2), (0, -1), (0, 0), (0, 1), (1, -1), (1, 0)),
+}
 
 
 class Renderer:
@@ -15,21 +33,47 @@ class Renderer:
     def __init__(self, width: int = WINDOW_WIDTH, height: int = WINDOW_HEIGHT):
         """Initialize the renderer with pygame."""
         pygame.init()
-        self.screen = pygame.display.set_mode((width, height), pygame.RESIZABLE)
+        self._set_display_mode((width, height), pygame.RESIZABLE)
         pygame.display.set_caption(WINDOW_TITLE)
         self.clock = pygame.time.Clock()
-        self.width = width
-        self.height = height
         self.is_fullscreen = False
         self.windowed_size = (width, height)  # Store original windowed size
 
+        # System fonts by point size, created once and shared by every caller
+        self._fonts = {}
+
         # Load custom fonts
         self._load_custom_fonts()
 
-        # Trail system
-        self.trails = {}  # Dictionary to store trails for each body
+        # Rendered body labels, keyed by name:
+        # (text surface, area of the shared background to blit, text width, text height)
+        self._label_cache = {}
+        # One translucent background shared by every label; each blits the part its size needs
+        self._label_bg = self._build_label_background(512, 64)
+        # Last rendered info line of each body shown by draw_info: (text, surface)
+        self._info_cache = {}
+        # Translucent overlay dimming the scene behind the menu; built on first use
+        self._menu_overlay = None
+        # Dimmed scene behind the open menu and the state it was drawn for: (scene key, surface)
+        self._menu_backdrop = None
+        # Rendered menu text keyed by (font, text, color); menu strings only change on user input
+        self._text_cache = {}
+
+        # Pre-rendered body circles with outline, keyed by (radius, color)
+        self._body_surfaces = {}
+
+        # Screen positions of the bodies drawn this frame, reused while the body count fits
+        self._projected = np.empty((0, 2), dtype=np.int32)
 
-        # Zoom system
+        # Trail system
+        # Screen-space trail points per body; the oldest point drops out once a trail is full
+        self.trails = defaultdict(lambda: TrailBuffer(TRAIL_LENGTH))
+        self._trails_drawn = set()  # Bodies whose trail was extended this frame
+        # Points that may drop off a full trail before the layer is redrawn to erase them
+        self._trail_slack = int(TRAIL_LENGTH * TRAIL_REDRAW_SLACK)
+        self._build_trail_layer()
+
+        # Zoom system; setting zoom also updates the cached pixels-per-km scale
         self.zoom = ZOOM_FACTOR
 
         # Camera system
@@ -37,33 +81,63 @@ class Renderer:
         self.camera_offset_y = 0.0  # Camera offset in world coordinates (km)
 
         # Star field
-        self.stars = self._generate_stars()
-
-    def _generate_stars(self) -> List[Tuple[int, int, Tuple[int, int, int], int]]:
-        """Generate random stars for the background based on current screen size."""
-        stars = []
-        num_stars = STAR_COUNT
-
-        for _ in range(num_stars):
-            x = random.randint(0, self.width)
-            y = random.randint(0, self.height)
-
-            # Choose a base color and apply brightness variation
-            base_color = random.choice(STAR_COLORS)
-            brightness_factor = random.uniform(0.3, 1.0)
-            color = tuple(int(c * brightness_factor) for c in base_color)
-
-            # 10% chance for larger, brighter stars
-            if random.random() < 0.1:
-                size = 2
-                # Make larger stars a bit brighter
-                color = tuple(min(255, int(c * 1.2)) for c in color)
-            else:
-                size = 1
-
-            stars.append((x, y, color, size))
-
-        return stars
+        self._build_starfield()
+
+    def _generate_stars(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Generate random stars for the background based on current screen size.
+
+        Returns:
+            Tuple of star positions as an (N, 2) int32 array, RGB colors as an
+            (N, 3) uint8 array and radii in pixels as an (N,) uint8 array
+        """
+        rng = np.random.default_rng()
+        num_stars = min(STAR_COUNT, MAX_STAR_COUNT)
+
+        x = rng.integers(0, self.width, num_stars, endpoint=True)
+        y = rng.integers(0, self.height, num_stars, endpoint=True)
+
+        # Choose a base color and apply brightness variation
+        base_colors = np.array(STAR_COLORS, dtype=np.float64)[rng.integers(0, len(STAR_COLORS), num_stars)]
+        brightness_factor = rng.uniform(0.3, 1.0, num_stars)
+        colors = (base_colors * brightness_factor[:, None]).astype(np.int64)
+
+        # 10% chance for larger, brighter stars
+        large = rng.random(num_stars) < 0.1
+        sizes = np.where(large, 2, 1)
+        # Make larger stars a bit brighter
+        colors[large] = np.minimum(255, (colors[large] * 1.2).astype(np.int64))
+
+        return (np.column_stack((x, y)).astype(np.int32), colors.astype(np.uint8), sizes.astype(np.uint8))
+
+    def _build_starfield(self) -> None:
+        """Generate stars and pre-render them onto a background surface."""
+        # Stars never move, so draw them once and blit the result every frame; the star
+        # arrays themselves are not kept, since a resize generates a fresh set anyway
+        positions, colors, sizes = self._generate_stars()
+        starfield = pygame.Surface((self.width, self.height)).convert()
+        starfield.fill(BACKGROUND_COLOR)
+
+        # Write every star as the pixels a circle of its radius would cover, one offset at a time
+        pixels = pygame.surfarray.pixels3d(starfield)
+        for size, offsets in _STAR_FOOTPRINTS.items():
+            of_size = sizes == size
+            star_x = positions[of_size, 0]
+            star_y = positions[of_size, 1]
+            star_colors = colors[of_size]
+            for dx, dy in offsets:
+                x = star_x + dx
+                y = star_y + dy
+                inside = (x >= 0) & (x < self.width) & (y >= 0) & (y < self.height)
+                pixels[x[inside], y[inside]] = star_colors[inside]
+        del pixels  # Unlock the surface
+        self._starfield = starfield
+
+    def _build_trail_layer(self) -> None:
+        """Create the persistent surface that trails are accumulated on."""
+        self._trail_layer = pygame.Surface((self.width, self.height)).convert()
+        self._trail_layer.set_colorkey(BACKGROUND_COLOR)
+        self._trail_layer_stale = False
 
     def _load_custom_fonts(self) -> None:
         """Load custom fonts from the fonts directory."""
@@ -101,8 +175,19 @@ class Renderer:
         except Exception as e:
             print(f"Error loading custom fonts: {e}")
 
-        # Set up fallback font (system default)
-        self.fallback_font = pygame.font.Font(None, 16)
+        # Set up fallback font (system default), the same size as the body labels it stands in for
+        self.fallback_font = self._get_font(LABEL_FONT_SIZE)
+
+        # System font for the velocity readout while dragging, and its last render: (text, color, surface)
+        self.arrow_font = self._get_font(24)
+        self._arrow_text = (None, None, None)
+
+    def _get_font(self, size: int) -> pygame.font.Font:
+        """Get the system font at a point size, creating it only the first time."""
+        font = self._fonts.get(size)
+        if font is None:
+            font = self._fonts[size] = pygame.font.Font(None, size)
+        return font
 
     def get_font(self, font_name: str = 'red_alert_medium') -> pygame.font.Font:
         """Get a font by name, falling back to system font if not available."""
@@ -110,38 +195,67 @@ class Renderer:
 
     def draw_starfield(self) -> None:
         """Draw the starry background."""
-        for x, y, color, size in self.stars:
-            pygame.draw.circle(self.screen, color, (x, y), size)
+        self.screen.blit(self._starfield, (0, 0))
+
+    @property
+    def zoom(self) -> float:
+        """Current zoom level."""
+        return self._zoom
+
+    @zoom.setter
+    def zoom(self, value: float) -> None:
+        # Every projection reads the pixels-per-km factor, so compute it once per zoom change
+        self._zoom = value
+        self._scale = SCALE_FACTOR * value
 
     def world_to_screen(self, x_km: float, y_km: float) -> Tuple[int, int]:
         """Convert world coordinates (km) to screen coordinates (pixels)."""
-        center_x = self.width // 2
-        center_y = self.height // 2
-        # Apply camera offset
-        adjusted_x = x_km - self.camera_offset_x
-        adjusted_y = y_km - self.camera_offset_y
-        screen_x = int(center_x + adjusted_x * SCALE_FACTOR * self.zoom)
-        screen_y = int(center_y - adjusted_y * SCALE_FACTOR * self.zoom)  # Flip Y axis
+        scale = self._scale
+        screen_x = int(self._center_x + (x_km - self.camera_offset_x) * scale)
+        screen_y = int(self._center_y - (y_km - self.camera_offset_y) * scale)  # Flip Y axis
         return (screen_x, screen_y)
 
+    def project_bodies(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Convert arrays of world coordinates (km) to an (N, 2) array of screen coordinates (pixels).
+
+        The result is a view of a buffer that is overwritten by the next call.
+        """
+        count = len(xs)
+        if len(self._projected) < count:
+            self._projected = np.empty((max(count, 2 * len(self._projected)), 2), dtype=np.int32)
+        screen = self._projected[:count]
+        scale = self._scale
+        # Assigning into the int32 buffer truncates toward zero, matching int() in world_to_screen
+        screen[:, 0] = self._center_x + (xs - self.camera_offset_x) * scale
+        screen[:, 1] = self._center_y - (ys - self.camera_offset_y) * scale  # Flip Y axis
+        return screen
+
+    def compute_screen_positions(self, objects: Sequence) -> np.ndarray:
+        """Project the x_position/y_position (km) of many bodies or markers to an (N, 2) array of pixels.
+
+        The result is a view of a buffer that is overwritten by the next projection.
+        """
+        count = len(objects)
+        xs = np.fromiter((obj.x_position for obj in objects), dtype=np.float64, count=count)
+        ys = np.fromiter((obj.y_position for obj in objects), dtype=np.float64, count=count)
+        return self.project_bodies(xs, ys)
+
     def screen_to_world(self, screen_x: int, screen_y: int) -> Tuple[float, float]:
         """Convert screen coordinates (pixels) to world coordinates (km)."""
-        center_x = self.width // 2
-        center_y = self.height // 2
-        world_x = (screen_x - center_x) / (SCALE_FACTOR * self.zoom) + self.camera_offset_x
-        world_y = (center_y - screen_y) / (SCALE_FACTOR * self.zoom) + self.camera_offset_y  # Flip Y axis back
+        world_x = (screen_x - self._center_x) / self._scale + self.camera_offset_x
+        world_y = (self._center_y - screen_y) / self._scale + self.camera_offset_y  # Flip Y axis back
         return (world_x, world_y)
 
     def move_camera(self, delta_screen_x: int, delta_screen_y: int, clear_markers_callback=None) -> None:
         """Move the camera by screen pixel amounts."""
         # Convert screen delta to world delta and apply to camera offset
-        delta_world_x = delta_screen_x / (SCALE_FACTOR * self.zoom)
-        delta_world_y = -delta_screen_y / (SCALE_FACTOR * self.zoom)  # Flip Y for world coordinates
+        delta_world_x = delta_screen_x / self._scale
+        delta_world_y = -delta_screen_y / self._scale  # Flip Y for world coordinates
         self.camera_offset_x += delta_world_x
         self.camera_offset_y += delta_world_y
 
         # Clear trails when camera moves to prevent distortion
-        self.trails.clear()
+        self.clear_trails()
 
         # Clear collision markers if callback provided
         if clear_markers_callback:
@@ -153,22 +267,16 @@ class Renderer:
         self.camera_offset_y = 0.0
         self.zoom = ZOOM_FACTOR
         # Clear trails when resetting view
-        self.trails.clear()
+        self.clear_trails()
         print("Camera position and zoom reset to defaults")
 
-    def calculate_render_radius(self, body: CelestialBody) -> int:
-        """Calculate the radius for rendering a celestial body."""
-        # Scale the radius with zoom - no cap, allowing true size when zoomed in
-        scaled_radius = max(int(body.radius_km * SCALE_FACTOR * self.zoom), MIN_RENDER_RADIUS)
-        return scaled_radius
-
     def zoom_in(self, clear_markers_callback=None) -> None:
         """Zoom in by multiplying zoom level."""
         old_zoom = self.zoom
         self.zoom = min(self.zoom * 1.2, MAX_ZOOM)  # 20% increase each step
         # Clear trails when zoom changes to prevent distortion
         if self.zoom != old_zoom:
-            self.trails.clear()
+            self.clear_trails()
             # Clear collision markers if callback provided
             if clear_markers_callback:
                 clear_markers_callback()
@@ -179,7 +287,7 @@ class Renderer:
         self.zoom = max(self.zoom / 1.2, MIN_ZOOM)  # 20% decrease each step
         # Clear trails when zoom changes to prevent distortion
         if self.zoom != old_zoom:
-            self.trails.clear()
+            self.clear_trails()
             # Clear collision markers if callback provided
             if clear_markers_callback:
                 clear_markers_callback()
@@ -196,8 +304,7 @@ class Renderer:
         """Toggle between fullscreen and windowed mode."""
         if self.is_fullscreen:
             # Switch to windowed mode
-            self.screen = pygame.display.set_mode(self.windowed_size)
-            self.width, self.height = self.windowed_size
+            self._set_display_mode(self.windowed_size)
             self.is_fullscreen = False
             print("Switched to windowed mode")
         else:
@@ -205,150 +312,288 @@ class Renderer:
             # Get current display info
             info = pygame.display.Info()
             fullscreen_size = (info.current_w, info.current_h)
-            self.screen = pygame.display.set_mode(fullscreen_size, pygame.FULLSCREEN)
-            self.width, self.height = fullscreen_size
+            self._set_display_mode(fullscreen_size, pygame.FULLSCREEN)
             self.is_fullscreen = True
             print(f"Switched to fullscreen mode ({self.width}x{self.height})")
 
-        # Regenerate stars for new screen size
-        self.stars = self._generate_stars()
+        self._rebuild_screen_surfaces()
+
+    def _set_display_mode(self, size: Tuple[int, int], flags: int = 0) -> None:
+        """Create the display surface and update the cached size and center to match it."""
+        self.screen = pygame.display.set_mode(size, flags)
+        self.width, self.height = size
+        # Every projection reads the center, so it is computed only when the size changes
+        self._center_x = self.width // 2
+        self._center_y = self.height // 2
+
+    def _rebuild_screen_surfaces(self) -> None:
+        """Rebuild everything sized to or converted for the display after it is recreated."""
+        # Regenerate stars and the trail layer for new screen size
+        self._build_starfield()
+        self._build_trail_layer()
+        self._reset_converted_surfaces()
         # Clear trails to prevent distortion
-        self.trails.clear()
+        self.clear_trails()
+
+    def _reset_converted_surfaces(self) -> None:
+        """Drop cached surfaces converted to the old display format so they are rebuilt for the new one."""
+        self._body_surfaces.clear()
+        self._label_cache.clear()
+        self._menu_overlay = None
+        self._menu_backdrop = None
+        self._text_cache.clear()
+        self._label_bg = self._build_label_background(self._label_bg.get_width(), self._label_bg.get_height())
 
     def handle_resize(self, new_width: int, new_height: int) -> None:
         """Handle window resize events (including maximize button)."""
+        # Nothing to rebuild if the window ended up the size it already was
+        if (new_width, new_height) == (self.width, self.height):
+            return
+
         if not self.is_fullscreen:
             # Update windowed size if not in fullscreen
             self.windowed_size = (new_width, new_height)
 
-        # Update screen dimensions
-        self.width = new_width
-        self.height = new_height
-
         # Recreate the display surface with new size
         if self.is_fullscreen:
-            self.screen = pygame.display.set_mode((new_width, new_height), pygame.FULLSCREEN)
+            self._set_display_mode((new_width, new_height), pygame.FULLSCREEN)
         else:
-            self.screen = pygame.display.set_mode((new_width, new_height), pygame.RESIZABLE)
+            self._set_display_mode((new_width, new_height), pygame.RESIZABLE)
 
-        # Regenerate stars for new screen size
-        self.stars = self._generate_stars()
-        # Clear trails to prevent distortion
-        self.trails.clear()
+        self._rebuild_screen_surfaces()
 
         print(f"Window resized to {new_width}x{new_height}")
 
-    def draw_body(self, body: CelestialBody) -> None:
-        """Draw a single celestial body with label."""
-        screen_pos = self.world_to_screen(body.x_position, body.y_position)
-        radius = self.calculate_render_radius(body)
-
-        # Draw the body
-        pygame.draw.circle(self.screen, body.color, screen_pos, radius)
-
-        # Draw outline
-        pygame.draw.circle(self.screen, (255, 255, 255), screen_pos, radius, 1)
-
-        # Draw label if enabled
+    def draw_bodies(self, bodies: List[CelestialBody], _min_radius: int = MIN_RENDER_RADIUS) -> None:
+        """Draw every body, reading the label and trail toggles once for the whole frame."""
+        # Project, size and cull every body in one pass; only bodies whose disc (and its
+        # outline) reaches the screen are drawn and labelled
+        count = len(bodies)
+        xs = np.fromiter((body.x_position for body in bodies), dtype=np.float64, count=count)
+        ys = np.fromiter((body.y_position for body in bodies), dtype=np.float64, count=count)
+        radii_km = np.fromiter((body.radius_km for body in bodies), dtype=np.float64, count=count)
+        positions, radii, on_screen = compute_body_draws(
+            xs, ys, radii_km, self._scale, self._center_x, self._center_y,
+            self.camera_offset_x, self.camera_offset_y, self.width, self.height, _min_radius)
+        shown = list(compress(bodies, on_screen.tolist()))
+        shown_positions = positions[on_screen].tolist()
+        shown_radii = radii[on_screen].tolist()
+
+        self._draw_discs(shown, shown_positions, shown_radii)
+
+        # Draw labels if enabled, above every disc
         if settings.SHOW_LABELS:
-            self._draw_body_label(body, screen_pos, radius)
+            self._draw_labels(shown, shown_positions, shown_radii)
 
-        # Update trail
+        # Update trails, off-screen bodies included, so a trail stays continuous when its body
+        # leaves the screen and comes back, and is not pruned as if the body were gone
         if settings.SHOW_TRAILS:
-            self._update_trail(body, screen_pos)
-
-    def _draw_body_label(self, body: CelestialBody, screen_pos: Tuple[int, int], radius: int) -> None:
-        """Draw a label next to the celestial body."""
-        font = self.get_font('red_alert_small')
-        text_surface = font.render(body.name, True, LABEL_COLOR)
-
-        # Position label to the right and slightly above the body
-        label_x = screen_pos[0] + radius + LABEL_OFFSET
-        label_y = screen_pos[1] - text_surface.get_height() // 2
-
-        # Keep label on screen
-        if label_x + text_surface.get_width() > self.width:
-            label_x = screen_pos[0] - text_surface.get_width() - LABEL_OFFSET
-        if label_y < 0:
-            label_y = 0
-        if label_y + text_surface.get_height() > self.height:
-            label_y = self.height - text_surface.get_height()
-
-        # Draw semi-transparent background for better readability
-        label_rect = pygame.Rect(label_x - 2, label_y - 1,
-                                text_surface.get_width() + 4,
-                                text_surface.get_height() + 2)
-
-        # Create a surface for the background with alpha
-        bg_surface = pygame.Surface((label_rect.width, label_rect.height))
-        bg_surface.set_alpha(LABEL_BACKGROUND_ALPHA)
+            self._update_trails(bodies, positions.tolist())
+
+    def _draw_discs(self, bodies: Sequence[CelestialBody], positions: Sequence[Sequence[int]],
+                    radii: Sequence[int], _sprite_max_radius: int = BODY_SPRITE_MAX_RADIUS) -> None:
+        """Draw the outlined disc of each body at its screen position and pixel radius."""
+        screen = self.screen
+        sprites = self._body_surfaces
+        batch = []
+        for body, (x, y), radius in zip(bodies, positions, radii):
+            if radius <= _sprite_max_radius:
+                # Small bodies keep the same size for a whole zoom level, so blit a cached sprite
+                sprite = sprites.get((radius, body.color))
+                if sprite is None:
+                    sprite = self._render_body_sprite(radius, body.color)
+                batch.append((sprite, (x - radius - 1, y - radius - 1)))
+            else:
+                # Flush the queued sprites first so bodies still overlap in list order
+                if batch:
+                    screen.blits(batch, False)
+                    batch.clear()
+
+                # Draw the body
+                pygame.draw.circle(screen, body.color, (x, y), radius)
+
+                # Draw outline
+                pygame.draw.circle(screen, (255, 255, 255), (x, y), radius, 1)
+
+        # Every queued sprite goes to the screen in one call
+        if batch:
+            screen.blits(batch, False)
+
+    def _render_body_sprite(self, radius: int, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Render and cache a filled, outlined circle of the given radius and color."""
+        size = 2 * radius + 2
+        sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, color, (radius + 1, radius + 1), radius)
+        pygame.draw.circle(sprite, (255, 255, 255), (radius + 1, radius + 1), radius, 1)
+        sprite = sprite.convert_alpha()
+        self._body_surfaces[(radius, color)] = sprite
+        return sprite
+
+    def _draw_labels(self, bodies: Sequence[CelestialBody], positions: Sequence[Sequence[int]],
+                     radii: Sequence[int], _label_offset: int = LABEL_OFFSET) -> None:
+        """Draw the name of each body next to its disc, all in one batched blit."""
+        cache = self._label_cache
+        width = self.width
+        height = self.height
+        batch = []
+        for body, (x, y), radius in zip(bodies, positions, radii):
+            # Names never change, so each label and its background are only rendered once
+            label = cache.get(body.name)
+            if label is None:
+                label = self._render_label(body.name)
+            text_surface, bg_area, text_width, text_height = label
+
+            # Position label to the right of the body, flipping to the left near the screen edge
+            label_x = x + radius + _label_offset
+            if label_x + text_width > width:
+                label_x = x - text_width - _label_offset
+
+            # Center it vertically on the body, clamped to the screen
+            label_y = min(max(y - text_height // 2, 0), height - text_height)
+
+            # Semi-transparent background for better readability, then the text over it
+            batch.append((self._label_bg, (label_x - 2, label_y - 1), bg_area))
+            batch.append((text_surface, (label_x, label_y)))
+
+        if batch:
+            self.screen.blits(batch, False)
+
+    def _render_label(self, name: str) -> Tuple[pygame.Surface, pygame.Rect, int, int]:
+        """Render and cache a body name, the area of the shared background behind it and its size."""
+        text_surface = self.get_font('red_alert_small').render(name, True, LABEL_COLOR).convert_alpha()
+        text_width, text_height = text_surface.get_size()
+        bg_area = pygame.Rect(0, 0, text_width + 4, text_height + 2)
+
+        # Grow the shared background if this label is larger than any before it
+        if not self._label_bg.get_rect().contains(bg_area):
+            self._label_bg = self._build_label_background(max(bg_area.width, self._label_bg.get_width()),
+                                                          max(bg_area.height, self._label_bg.get_height()))
+
+        label = self._label_cache[name] = (text_surface, bg_area, text_width, text_height)
+        return label
+
+    def _build_label_background(self, width: int, height: int) -> pygame.Surface:
+        """Create a semi-transparent label background of the given size."""
+        bg_surface = pygame.Surface((width, height)).convert()
         bg_surface.fill(LABEL_BACKGROUND_COLOR)
-        self.screen.blit(bg_surface, (label_rect.x, label_rect.y))
-
-        # Draw the text
-        self.screen.blit(text_surface, (label_x, label_y))
+        bg_surface.set_alpha(LABEL_BACKGROUND_ALPHA)
+        return bg_surface
 
-    def _update_trail(self, body: CelestialBody, screen_pos: Tuple[int, int]) -> None:
-        """Update the trail for a celestial body."""
+    def _update_trails(self, bodies: Sequence[CelestialBody], positions: Sequence[Sequence[int]],
+                       _trail_color: Tuple[int, int, int] = TRAIL_COLOR) -> None:
+        """Extend the trail of each body with its screen position, drawing the newest segments."""
         # Use object ID instead of name to ensure uniqueness for each body instance
-        body_id = id(body)
-        if body_id not in self.trails:
-            self.trails[body_id] = []
-
-        trail = self.trails[body_id]
-        trail.append(screen_pos)
-
-        # Limit trail length (0 means unlimited)
-        if TRAIL_LENGTH > 0 and len(trail) > TRAIL_LENGTH:
-            trail.pop(0)
+        body_ids = [id(body) for body in bodies]
+        self._trails_drawn.update(body_ids)
+
+        trails = self.trails
+        layer = self._trail_layer
+        slack = self._trail_slack
+        draw_line = pygame.draw.line
+        stale = False
+        for body_id, screen_pos in zip(body_ids, positions):
+            trail = trails[body_id]
+            if trail:
+                # Only the newest segment has to be added to the layer
+                draw_line(layer, _trail_color, trail.last(), screen_pos, 1)
+            trail.append(screen_pos)
+            # Segments that fell off the end are still on the layer; redrawing every trail costs
+            # far more than one segment, so it is only done once a few have piled up
+            stale = stale or trail.dropped > slack
+        if stale:
+            self._trail_layer_stale = True
+
+    def draw_trails(self) -> None:
+        """Draw the trails of every body extended since the last call."""
+        if not settings.SHOW_TRAILS:
+            self._trails_drawn.clear()
+            return
 
-        # Draw trail
-        if len(trail) > 1:
-            pygame.draw.lines(self.screen, TRAIL_COLOR, False, trail, 1)
+        # Forget trails of bodies that are gone (e.g. destroyed in a collision)
+        if len(self._trails_drawn) != len(self.trails):
+            for body_id in [body_id for body_id in self.trails if body_id not in self._trails_drawn]:
+                del self.trails[body_id]
+            self._trail_layer_stale = True
+        self._trails_drawn.clear()
+
+        if self._trail_layer_stale:
+            self._trail_layer.fill(BACKGROUND_COLOR)
+            width, height = self.width, self.height
+            for trail in self.trails.values():
+                trail.dropped = 0
+                if len(trail) > 1:
+                    # Skip trails lying wholly off screen, such as those of distant bodies when zoomed in
+                    min_x, min_y, max_x, max_y = trail.bounds()
+                    if max_x < 0 or min_x >= width or max_y < 0 or min_y >= height:
+                        continue
+                    pygame.draw.lines(self._trail_layer, TRAIL_COLOR, False, trail.points(), 1)
+            self._trail_layer_stale = False
+
+        self.screen.blit(self._trail_layer, (0, 0))
+
+    def clear_trails(self) -> None:
+        """Erase all trails."""
+        self.trails.clear()
+        self._trails_drawn.clear()
+        self._trail_layer.fill(BACKGROUND_COLOR)
+        self._trail_layer_stale = False
 
     def draw_info(self, bodies: List[CelestialBody]) -> None:
         """Draw information text on screen."""
         font = self.get_font('red_alert_small')
         y_offset = 10
+        previous = self._info_cache
+        # Only lines drawn this frame are kept, so bodies that are gone drop out of the cache
+        self._info_cache = cache = {}
 
         for body in bodies:
+            # Lines below the bottom of the screen would never be seen
+            if y_offset >= self.height:
+                break
+
             # Format position and velocity in scientific notation for compactness
             info_text = f"{body.name}: ({body.x_position:.2e}, {body.y_position:.2e}) km, " \
                          f"({body.x_velocity:.2e}, {body.y_velocity:.2e}) km/s"
 
+            # Re-render only when the rounded values change, which slow bodies rarely do
+            body_id = id(body)
+            cached = previous.get(body_id)
+            if cached is not None and cached[0] == info_text:
+                info_surface = cached[1]
+            else:
+                info_surface = font.render(info_text, True, (255, 255, 255))
+            cache[body_id] = (info_text, info_surface)
+
             # Draw information
-            info_surface = font.render(info_text, True, (255, 255, 255))
             self.screen.blit(info_surface, (10, y_offset))
             y_offset += 20
 
     def clear_screen(self) -> None:
-        """Clear the screen with background color and draw stars."""
-        self.screen.fill(BACKGROUND_COLOR)
-        self.draw_starfield()
-
-    def draw_impact_marker(self, marker) -> None:
-        """Draw a red X marker at an impact site."""
-        screen_pos = self.world_to_screen(marker.x_position, marker.y_position)
+        """Clear the screen to the starry background."""
+        # The pre-rendered starfield already includes the background color, so one blit covers both
+        self.screen.blit(self._starfield, (0, 0))
 
-        # Don't draw if off screen
-        if (screen_pos[0] < -50 or screen_pos[0] > self.width + 50 or
-            screen_pos[1] < -50 or screen_pos[1] > self.height + 50):
+    def draw_impact_markers(self, markers: Sequence) -> None:
+        """Draw a red X marker at every impact site, projecting them all in one pass."""
+        if not markers:
             return
+        positions = self.compute_screen_positions(markers)
 
-        # Draw X marker
-        size = marker.size
-        x, y = screen_pos
+        # Don't draw markers off screen
+        xs = positions[:, 0]
+        ys = positions[:, 1]
+        on_screen = (xs >= -50) & (xs <= self.width + 50) & (ys >= -50) & (ys <= self.height + 50)
 
-        # Draw the X with two lines
-        pygame.draw.line(self.screen, marker.color,
-                        (x - size, y - size), (x + size, y + size), 2)
-        pygame.draw.line(self.screen, marker.color,
-                        (x - size, y + size), (x + size, y - size), 2)
+        screen = self.screen
+        draw_line = pygame.draw.line
+        for marker, (x, y) in zip(compress(markers, on_screen.tolist()), positions[on_screen].tolist()):
+            size = marker.size
+            # Draw the X with two lines
+            draw_line(screen, marker.color, (x - size, y - size), (x + size, y + size), 2)
+            draw_line(screen, marker.color, (x - size, y + size), (x + size, y - size), 2)
 
     def draw_velocity_arrow(self, start_pos, end_pos, color=(255, 255, 0), velocity_scale=0.1) -> None:
         """Draw an arrow showing velocity direction and magnitude."""
-        import math
-
         # Don't draw if positions are the same
         if start_pos == end_pos:
             return
@@ -356,7 +601,7 @@ class Renderer:
         # Calculate arrow components
         dx = end_pos[0] - start_pos[0]
         dy = end_pos[1] - start_pos[1]
-        length = math.sqrt(dx * dx + dy * dy)
+        length = _hypot(dx, dy)
 
         # Don't draw very short arrows
         if length < 5:
@@ -367,15 +612,15 @@ class Renderer:
 
         # Draw arrowhead
         if length > 10:  # Only draw arrowhead if arrow is long enough
-            angle = math.atan2(dy, dx)
             arrowhead_length = min(length * 0.3, 15)  # Arrowhead size proportional to arrow length, max 15px
-            arrowhead_angle = 0.5  # Angle of arrowhead sides
 
-            # Calculate arrowhead points
-            arrowhead1_x = end_pos[0] - arrowhead_length * math.cos(angle - arrowhead_angle)
-            arrowhead1_y = end_pos[1] - arrowhead_length * math.sin(angle - arrowhead_angle)
-            arrowhead2_x = end_pos[0] - arrowhead_length * math.cos(angle + arrowhead_angle)
-            arrowhead2_y = end_pos[1] - arrowhead_length * math.sin(angle + arrowhead_angle)
+            # Rotate the reversed unit direction by +/- the arrowhead angle for each side
+            ux = dx / length
+            uy = dy / length
+            arrowhead1_x = end_pos[0] - arrowhead_length * (ux * _AH_C + uy * _AH_S)
+            arrowhead1_y = end_pos[1] - arrowhead_length * (uy * _AH_C - ux * _AH_S)
+            arrowhead2_x = end_pos[0] - arrowhead_length * (ux * _AH_C - uy * _AH_S)
+            arrowhead2_y = end_pos[1] - arrowhead_length * (uy * _AH_C + ux * _AH_S)
 
             # Draw arrowhead lines
             pygame.draw.line(self.screen, color, end_pos, (arrowhead1_x, arrowhead1_y), 3)
@@ -383,9 +628,13 @@ class Renderer:
 
         # Draw velocity magnitude text
         velocity_magnitude = length * velocity_scale
-        font = pygame.font.Font(None, 24)
         speed_text = f"{velocity_magnitude:.1f} km/s"
-        text_surface = font.render(speed_text, True, color)
+        # The speed rarely changes at one decimal between frames of a drag, so keep the last render
+        if self._arrow_text[:2] == (speed_text, color):
+            text_surface = self._arrow_text[2]
+        else:
+            text_surface = self.arrow_font.render(speed_text, True, color)
+            self._arrow_text = (speed_text, color, text_surface)
 
         # Position text near the middle of the arrow
         text_x = (start_pos[0] + end_pos[0]) // 2
@@ -401,13 +650,11 @@ class Renderer:
 
         self.screen.blit(text_surface, (text_x, text_y))
 
-    def draw_menu(self, menu_state: str, menu_selection: int, options: List[str], settings_manager, audio_manager) -> None:
-        """Draw the menu system based on current state."""
-        # Create semi-transparent overlay
-        overlay = pygame.Surface((self.width, self.height))
-        overlay.set_alpha(180)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+    def draw_menu(self, menu_state: str, menu_selection: int, options: List[str], settings_manager, audio_manager,
+                  dim_scene: bool = True) -> None:
+        """Draw the menu system based on current state, dimming the scene behind it unless told otherwise."""
+        if dim_scene:
+            self._dim_screen()
 
         # Calculate required height for menu content
         title_height = 60
@@ -436,7 +683,7 @@ class Renderer:
         # Draw title
         title_text = self._get_menu_title(menu_state)
         title_font = self.custom_fonts.get('red_alert_title', self.fallback_font)
-        title_surface = title_font.render(title_text, True, (255, 255, 255))
+        title_surface = self._render_text(title_font, title_text, (255, 255, 255))
         title_x = menu_x + (menu_width - title_surface.get_width()) // 2
         title_y = menu_y + 20
         self.screen.blit(title_surface, (title_x, title_y))
@@ -475,7 +722,7 @@ class Renderer:
                 font = self.custom_fonts.get('red_alert_large', self.fallback_font)
                 line_height = 50  # Normal line height
 
-            text_surface = font.render(option_text, True, color)
+            text_surface = self._render_text(font, option_text, color)
             text_x = menu_x + 40
             text_y = start_y + i * line_height
             self.screen.blit(text_surface, (text_x, text_y))
@@ -486,11 +733,44 @@ class Renderer:
             instruction_text = "  •  ".join(instructions)
             instruction_start_y = menu_y + menu_height - 30  # Single line height
             medium_font = self.custom_fonts.get('red_alert_medium', self.fallback_font)
-            instruction_surface = medium_font.render(instruction_text, True, (200, 200, 200))
+            instruction_surface = self._render_text(medium_font, instruction_text, (200, 200, 200))
             # Center the instruction text horizontally
             instruction_x = menu_x + (menu_width - instruction_surface.get_width()) // 2
             self.screen.blit(instruction_surface, (instruction_x, instruction_start_y))
 
+    def _dim_screen(self) -> None:
+        """Dim everything on screen with a semi-transparent overlay, built once per screen size."""
+        if self._menu_overlay is None:
+            self._menu_overlay = pygame.Surface((self.width, self.height)).convert()
+            self._menu_overlay.set_alpha(180)
+            self._menu_overlay.fill((0, 0, 0))
+        self.screen.blit(self._menu_overlay, (0, 0))
+
+    def save_menu_backdrop(self, scene_key) -> None:
+        """Dim the scene just drawn for the menu and keep a copy to show again while scene_key holds."""
+        self._dim_screen()
+        self._menu_backdrop = (scene_key, self.screen.copy())
+
+    def draw_menu_backdrop(self, scene_key) -> bool:
+        """Show the dimmed scene saved under scene_key; return False if it has to be drawn afresh."""
+        backdrop = self._menu_backdrop
+        if backdrop is None or backdrop[0] != scene_key:
+            return False
+        self.screen.blit(backdrop[1], (0, 0))
+        return True
+
+    def discard_menu_backdrop(self) -> None:
+        """Forget the saved menu backdrop."""
+        self._menu_backdrop = None
+
+    def _render_text(self, font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Render menu text once per font, string and color, reusing the surface afterwards."""
+        key = (font, text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = self._text_cache[key] = font.render(text, True, color).convert_alpha()
+        return surface
+
     def _get_menu_title(self, menu_state: str) -> str:
         """Get the title for the current menu state."""
         titles = {
@@ -555,6 +835,11 @@ class Renderer:
         pygame.display.flip()
         self.clock.tick(FPS)
 
+    def present_cached(self) -> None:
+        """Show the previous frame again without redrawing it."""
+        # The window still holds the last flipped frame, so only keep the frame rate
+        self.clock.tick(FPS)
+
     def quit(self) -> None:
         """Clean up pygame resources."""
         pygame.quit()
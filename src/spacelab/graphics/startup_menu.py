@@ -33,8 +33,8 @@ class StartupMenu:
             spacelab_dir = os.path.dirname(current_dir)
             image_path = os.path.join(spacelab_dir, "media", "images", "8bit-space.jpg")
             self.background_image = pygame.image.load(image_path)
-            # Scale the background to fit the screen
-            self.background_image = pygame.transform.scale(self.background_image, screen.get_size())
+            # Scale the background to fit the screen, in the display's pixel format so blits need no conversion
+            self.background_image = pygame.transform.scale(self.background_image, screen.get_size()).convert()
         except Exception as e:
             print(f"Warning: Could not load background image: {e}")
             self.background_image = None
@@ -189,7 +189,7 @@ class StartupMenu:
             self.screen.fill((20, 20, 40))
 
         # Create a semi-transparent overlay for the menu area
-        menu_surface = pygame.Surface((self.menu_width, self.menu_height))
+        menu_surface = pygame.Surface((self.menu_width, self.menu_height)).convert()
         menu_surface.set_alpha(200)  # Semi-transparent
         menu_surface.fill((20, 20, 40))  # Dark blue background
 
@@ -0,0 +1,70 @@
+"""Ring buffer of screen-space points for drawing body trails."""
+
+from typing import List, Optional, Tuple
+import numpy as np
+
+# Points a new trail has room for before its storage first grows
+INITIAL_CAPACITY = 256
+
+
+class TrailBuffer:
+    """Bounded ring buffer of trail points backed by a NumPy array.
+
+    Appending is O(1) amortized. Like a deque the storage starts small and
+    doubles as points arrive, up to maxlen; once the trail holds maxlen
+    points each new point overwrites the oldest one. With no maximum length
+    the buffer keeps growing instead.
+    """
+
+    def __init__(self, maxlen: Optional[int] = None):
+        """Create an empty trail holding at most maxlen points (None = unlimited)."""
+        self.maxlen = maxlen or None
+        self._points = np.empty((min(self.maxlen or INITIAL_CAPACITY, INITIAL_CAPACITY), 2), dtype=np.int32)
+        self._head = 0  # Index the next point is written to
+        self._length = 0
+        self.dropped = 0  # Points overwritten since the owner last reset this count
+        self._last = None  # Newest point, kept as given so reading it back needs no array access
+
+    def __len__(self) -> int:
+        return self._length
+
+    def last(self) -> Tuple[int, int]:
+        """Get the most recently appended point."""
+        return self._last
+
+    def append(self, point: Tuple[int, int]) -> None:
+        """Add a point, dropping the oldest one if the trail is full."""
+        capacity = len(self._points)
+        if self._length == capacity:
+            if self.maxlen is None or capacity < self.maxlen:
+                # Nothing has been overwritten yet, so the points are stored in order: just grow
+                new_capacity = 2 * capacity if self.maxlen is None else min(2 * capacity, self.maxlen)
+                self._points = np.concatenate((self._points, np.empty((new_capacity - capacity, 2), dtype=np.int32)))
+                self._head = capacity
+                capacity = new_capacity
+            else:
+                self._length -= 1
+                self.dropped += 1
+
+        self._points[self._head] = point
+        self._last = point
+        self._head = (self._head + 1) % capacity
+        self._length += 1
+
+    def bounds(self) -> Tuple[int, int, int, int]:
+        """Get the bounding box (min_x, min_y, max_x, max_y) of the trail points."""
+        start = self._head - self._length
+        # Storage only wraps once it is full, and then every stored point is part of the trail
+        stored = self._points[start:self._head] if start >= 0 else self._points
+        min_x, min_y = stored.min(axis=0).tolist()
+        max_x, max_y = stored.max(axis=0).tolist()
+        return (min_x, min_y, max_x, max_y)
+
+    def points(self) -> List[List[int]]:
+        """Get the trail points from oldest to newest."""
+        start = self._head - self._length
+        if start >= 0:
+            ordered = self._points[start:self._head]
+        else:
+            ordered = np.concatenate((self._points[start:], self._points[:self._head]))
+        return ordered.tolist()
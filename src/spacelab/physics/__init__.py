@@ -1,5 +1,8 @@
 """Physics engine initialization."""
 
-from .gravity import calculate_gravitational_force, apply_gravitational_forces
+from .body_arrays import BodyArrays
+from .gravity import (calculate_gravitational_force, apply_gravitational_forces,
+                      compute_gravitational_accelerations)
 
-__all__ = ["calculate_gravitational_force", "apply_gravitational_forces"]
+__all__ = ["BodyArrays", "calculate_gravitational_force", "apply_gravitational_forces",
+           "compute_gravitational_accelerations"]
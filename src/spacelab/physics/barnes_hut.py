@@ -0,0 +1,282 @@
+"""Barnes-Hut quadtree gravity for large numbers of bodies.
+
+The tree is stored flat in NumPy arrays indexed by node id, so it can be built
+and walked by JIT-compiled loops without any Python objects per node.
+"""
+
+import math
+from typing import Optional
+import numpy as np
+from ._kernels import jit
+
+# Deepest level a node may be split to; bodies that still share a leaf
+# there (e.g. coincident bodies) are chained in a list on that leaf
+MAX_DEPTH = 32
+
+# Values of QuadTree.leaf_body for nodes that hold no body of their own
+EMPTY_LEAF = -1
+INTERNAL_NODE = -2
+
+
+@jit
+def _init_node(node, center_x, center_y, half_size, child, leaf_body,
+               node_center_x, node_center_y, node_half_size):
+    """Initialise node as an empty leaf covering the given square."""
+    for quadrant in range(4):
+        child[node, quadrant] = -1
+    leaf_body[node] = EMPTY_LEAF
+    node_center_x[node] = center_x
+    node_center_y[node] = center_y
+    node_half_size[node] = half_size
+
+
+@jit
+def _quadrant(node, x, y, node_center_x, node_center_y):
+    """Index 0-3 of the child quadrant of node that contains (x, y)."""
+    quadrant = 0
+    if x >= node_center_x[node]:
+        quadrant += 1
+    if y >= node_center_y[node]:
+        quadrant += 2
+    return quadrant
+
+
+@jit
+def _add_child(node, quadrant, node_count, child, leaf_body,
+               node_center_x, node_center_y, node_half_size):
+    """Create the child of node in the given quadrant and return its id."""
+    half_size = node_half_size[node] * 0.5
+    center_x = node_center_x[node] + (half_size if quadrant & 1 else -half_size)
+    center_y = node_center_y[node] + (half_size if quadrant & 2 else -half_size)
+    _init_node(node_count, center_x, center_y, half_size, child, leaf_body,
+               node_center_x, node_center_y, node_half_size)
+    child[node, quadrant] = node_count
+    return node_count
+
+
+@jit
+def _build_tree(pos_x, pos_y, child, leaf_body, next_body,
+                node_center_x, node_center_y, node_half_size):
+    """
+    Insert every body into the tree.
+
+    Returns:
+        int: Number of nodes used, or -1 if the node arrays are too small
+    """
+    count = pos_x.shape[0]
+    capacity = leaf_body.shape[0]
+
+    # Root square covering all bodies
+    min_x = pos_x.min()
+    max_x = pos_x.max()
+    min_y = pos_y.min()
+    max_y = pos_y.max()
+    half_size = 0.5 * max(max_x - min_x, max_y - min_y)
+    half_size = half_size * (1.0 + 1e-9) + 1e-9
+    _init_node(0, 0.5 * (min_x + max_x), 0.5 * (min_y + max_y), half_size, child, leaf_body,
+               node_center_x, node_center_y, node_half_size)
+    node_count = 1
+
+    for body in range(count):
+        next_body[body] = -1
+        node = 0
+        depth = 0
+        while True:
+            occupant = leaf_body[node]
+            if occupant == INTERNAL_NODE:
+                quadrant = _quadrant(node, pos_x[body], pos_y[body], node_center_x, node_center_y)
+                next_node = child[node, quadrant]
+                if next_node < 0:
+                    if node_count >= capacity:
+                        return -1
+                    next_node = _add_child(node, quadrant, node_count, child, leaf_body,
+                                           node_center_x, node_center_y, node_half_size)
+                    node_count += 1
+                node = next_node
+                depth += 1
+            elif occupant == EMPTY_LEAF:
+                leaf_body[node] = body
+                break
+            elif depth >= MAX_DEPTH:
+                # Too deep to split further; chain the body onto this leaf
+                next_body[body] = occupant
+                leaf_body[node] = body
+                break
+            else:
+                # Split the leaf: push its single occupant down one level and retry
+                if node_count >= capacity:
+                    return -1
+                quadrant = _quadrant(node, pos_x[occupant], pos_y[occupant], node_center_x, node_center_y)
+                moved_to = _add_child(node, quadrant, node_count, child, leaf_body,
+                                      node_center_x, node_center_y, node_half_size)
+                node_count += 1
+                leaf_body[moved_to] = occupant
+                leaf_body[node] = INTERNAL_NODE
+
+    return node_count
+
+
+@jit
+def _compute_mass_distribution(node_count, pos_x, pos_y, mass, child, leaf_body, next_body,
+                               node_center_x, node_center_y, node_mass, center_of_mass_x,
+                               center_of_mass_y):
+    """Accumulate total mass and center of mass of every node, bottom-up."""
+    # Children are always created after their parent, so reverse id order is bottom-up
+    for node in range(node_count - 1, -1, -1):
+        total_mass = 0.0
+        moment_x = 0.0
+        moment_y = 0.0
+        if leaf_body[node] == INTERNAL_NODE:
+            for quadrant in range(4):
+                sub_node = child[node, quadrant]
+                if sub_node >= 0:
+                    total_mass += node_mass[sub_node]
+                    moment_x += node_mass[sub_node] * center_of_mass_x[sub_node]
+                    moment_y += node_mass[sub_node] * center_of_mass_y[sub_node]
+        else:
+            body = leaf_body[node]
+            while body >= 0:
+                total_mass += mass[body]
+                moment_x += mass[body] * pos_x[body]
+                moment_y += mass[body] * pos_y[body]
+                body = next_body[body]
+
+        node_mass[node] = total_mass
+        if total_mass > 0.0:
+            center_of_mass_x[node] = moment_x / total_mass
+            center_of_mass_y[node] = moment_y / total_mass
+        else:
+            center_of_mass_x[node] = node_center_x[node]
+            center_of_mass_y[node] = node_center_y[node]
+
+
+@jit
+def _tree_accelerations(pos_x, pos_y, mass, child, leaf_body, next_body, node_center_x,
+                        node_center_y, node_half_size, node_mass, center_of_mass_x,
+                        center_of_mass_y, acc_x, acc_y, G, theta, soft2):
+    """Walk the tree once per body and write its gravitational acceleration."""
+    count = pos_x.shape[0]
+    theta_sq = theta * theta
+    # A depth-first walk holds at most 3 pending siblings per level plus the 4 last pushed
+    stack = np.empty(3 * (MAX_DEPTH + 2) + 4, dtype=np.int64)
+
+    for i in range(count):
+        x = pos_x[i]
+        y = pos_y[i]
+        ax = 0.0
+        ay = 0.0
+        stack[0] = 0
+        top = 1
+        while top > 0:
+            top -= 1
+            node = stack[top]
+            if node_mass[node] == 0.0:
+                continue
+
+            if leaf_body[node] == INTERNAL_NODE:
+                dx = center_of_mass_x[node] - x
+                dy = center_of_mass_y[node] - y
+                distance_sq = dx * dx + dy * dy + soft2
+                size = 2.0 * node_half_size[node]
+                contains_body = (abs(x - node_center_x[node]) <= node_half_size[node]
+                                 and abs(y - node_center_y[node]) <= node_half_size[node])
+                if not contains_body and size * size < theta_sq * distance_sq:
+                    # Far enough away: treat the whole node as one pseudo-body
+                    inv_distance_cubed = 1.0 / (distance_sq * math.sqrt(distance_sq))
+                    pull = node_mass[node] * inv_distance_cubed
+                    ax += pull * dx
+                    ay += pull * dy
+                else:
+                    for quadrant in range(4):
+                        sub_node = child[node, quadrant]
+                        if sub_node >= 0:
+                            stack[top] = sub_node
+                            top += 1
+            else:
+                body = leaf_body[node]
+                while body >= 0:
+                    if body != i:
+                        dx = pos_x[body] - x
+                        dy = pos_y[body] - y
+                        distance_sq = dx * dx + dy * dy + soft2
+                        # Coincident bodies exert no force
+                        if distance_sq > 0.0:
+                            inv_distance_cubed = 1.0 / (distance_sq * math.sqrt(distance_sq))
+                            pull = mass[body] * inv_distance_cubed
+                            ax += pull * dx
+                            ay += pull * dy
+                    body = next_body[body]
+
+        acc_x[i] = G * ax
+        acc_y[i] = G * ay
+
+
+class QuadTree:
+    """Flat Barnes-Hut quadtree over a set of point masses.
+
+    The node arrays are kept between builds and only grow, so a tree that is
+    rebuilt every physics step stops allocating once it is large enough.
+    """
+
+    def __init__(self, pos_x: Optional[np.ndarray] = None, pos_y: Optional[np.ndarray] = None,
+                 mass: Optional[np.ndarray] = None):
+        """Create the tree, building it for the given bodies if any are passed."""
+        self.node_count = 0
+        self.next_body = np.empty(0, dtype=np.int64)
+        self._allocate_nodes(0)
+        if pos_x is not None:
+            self.build(pos_x, pos_y, mass)
+
+    def build(self, pos_x: np.ndarray, pos_y: np.ndarray, mass: np.ndarray) -> None:
+        """Rebuild the tree and its mass distribution for the given bodies."""
+        self.pos_x = pos_x
+        self.pos_y = pos_y
+        self.mass = mass
+        count = len(pos_x)
+        if len(self.next_body) < count:
+            self.next_body = np.empty(max(count, 2 * len(self.next_body)), dtype=np.int64)
+
+        # Uniformly spread bodies need about 2N nodes; grow if clustering needs more
+        if self.capacity < 4 * count + 16:
+            self._allocate_nodes(4 * count + 16)
+        while True:
+            self.node_count = _build_tree(pos_x, pos_y, self.child, self.leaf_body, self.next_body,
+                                          self.node_center_x, self.node_center_y,
+                                          self.node_half_size) if count else 0
+            if self.node_count >= 0:
+                break
+            self._allocate_nodes(2 * self.capacity)
+
+        _compute_mass_distribution(self.node_count, pos_x, pos_y, mass, self.child, self.leaf_body,
+                                   self.next_body, self.node_center_x, self.node_center_y,
+                                   self.node_mass, self.center_of_mass_x, self.center_of_mass_y)
+
+    def _allocate_nodes(self, capacity: int) -> None:
+        """Allocate per-node arrays for up to capacity nodes."""
+        self.child = np.empty((capacity, 4), dtype=np.int64)
+        self.leaf_body = np.empty(capacity, dtype=np.int64)
+        self.node_center_x = np.empty(capacity, dtype=np.float64)
+        self.node_center_y = np.empty(capacity, dtype=np.float64)
+        self.node_half_size = np.empty(capacity, dtype=np.float64)
+        self.node_mass = np.empty(capacity, dtype=np.float64)
+        self.center_of_mass_x = np.empty(capacity, dtype=np.float64)
+        self.center_of_mass_y = np.empty(capacity, dtype=np.float64)
+        self.capacity = capacity
+
+    def accelerations(self, acc_x: np.ndarray, acc_y: np.ndarray, G: float,
+                      theta: float = 0.5, soft2: float = 0.0) -> None:
+        """
+        Write the gravitational acceleration of every body into acc_x/acc_y.
+
+        Args:
+            acc_x, acc_y: Output arrays, one entry per body
+            G: Gravitational constant in the simulation's units
+            theta: Opening angle; nodes with size/distance below it are approximated
+            soft2: Squared softening length added to every distance
+        """
+        if self.node_count == 0:
+            return
+        _tree_accelerations(self.pos_x, self.pos_y, self.mass, self.child, self.leaf_body,
+                            self.next_body, self.node_center_x, self.node_center_y,
+                            self.node_half_size, self.node_mass, self.center_of_mass_x,
+                            self.center_of_mass_y, acc_x, acc_y, G, theta, soft2)
@@ -0,0 +1,122 @@
+"""Structure-of-arrays storage for vectorized body physics."""
+
+from typing import List
+import numpy as np
+from ..bodies.celestial_body import CelestialBody
+from ..config import settings
+from ._kernels import kick_drift
+
+# Array name and the body attribute it mirrors
+BODY_FIELDS = (
+    ("pos_x", "x_position"),
+    ("pos_y", "y_position"),
+    ("vel_x", "x_velocity"),
+    ("vel_y", "y_velocity"),
+    ("mass", "mass_kg"),
+    ("radius", "radius_km"),
+    ("satellite", "is_satellite"),  # 1.0 for satellites, 0.0 for every other body
+)
+
+# Scratch arrays for the per-step gravitational acceleration
+SCRATCH_FIELDS = ("acc_x", "acc_y")
+
+# Arrays stored as float32 when HIGH_PRECISION_MODE is off. Positions and velocities always
+# stay float64: one step's change to either is below float32 resolution for the outer
+# planets, so they would stall or fly in straight lines
+NARROW_FIELDS = ("mass",)
+
+# Smallest number of bodies the backing buffers are sized for
+MIN_CAPACITY = 16
+
+
+def field_dtype(field: str) -> type:
+    """Storage dtype of the named array under the current HIGH_PRECISION_MODE."""
+    if field in NARROW_FIELDS and not settings.HIGH_PRECISION_MODE:
+        return np.float32
+    return np.float64
+
+
+class BodyArrays:
+    """Parallel NumPy arrays holding the physical state of the simulated bodies.
+
+    Index ``i`` of every array refers to ``bodies[i]`` of the list the arrays
+    were loaded from, so physics can run over contiguous arrays and the results
+    can be written back to the body objects for rendering.
+
+    The arrays are views of the first ``len(self)`` entries of larger backing
+    buffers, so the store can be kept across frames and bodies can be appended
+    or removed without rebuilding it from the body objects.
+    """
+
+    def __init__(self, bodies: List[CelestialBody]):
+        """Gather the state of the given bodies into arrays."""
+        fields = [field for field, _ in BODY_FIELDS] + list(SCRATCH_FIELDS)
+        self._dtypes = {field: field_dtype(field) for field in fields}
+        self._allocate(max(len(bodies), MIN_CAPACITY))
+        self.load(bodies)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def load(self, bodies: List[CelestialBody]) -> None:
+        """Copy positions, velocities, masses and radii out of the body objects."""
+        count = len(bodies)
+        # Keep the current buffers when they are large enough
+        if count > self.capacity:
+            self._allocate(count)
+        for field, attribute in BODY_FIELDS:
+            self._buffers[field][:count] = np.fromiter(
+                (getattr(b, attribute) for b in bodies), dtype=self._dtypes[field], count=count)
+        self._resize(count)
+
+    def store(self, bodies: List[CelestialBody]) -> None:
+        """Write positions and velocities back to the body objects."""
+        state = zip(bodies, self.pos_x.tolist(), self.pos_y.tolist(),
+                    self.vel_x.tolist(), self.vel_y.tolist())
+        for body, x, y, vx, vy in state:
+            body.x_position = x
+            body.y_position = y
+            body.x_velocity = vx
+            body.y_velocity = vy
+
+    def append(self, body: CelestialBody) -> None:
+        """Add a body at the end of the arrays, growing the buffers if they are full."""
+        count = self._count
+        if count == self.capacity:
+            self.grow(2 * self.capacity)
+        for field, attribute in BODY_FIELDS:
+            self._buffers[field][count] = getattr(body, attribute)
+        self._resize(count + 1)
+
+    def grow(self, capacity: int) -> None:
+        """Enlarge the backing buffers to hold at least capacity bodies."""
+        if capacity <= self.capacity:
+            return
+        count = self._count
+        buffers = self._buffers
+        self._allocate(capacity)
+        for field, buffer in buffers.items():
+            self._buffers[field][:count] = buffer[:count]
+        self._resize(count)
+
+    def keep(self, mask: np.ndarray) -> None:
+        """Drop every body whose entry in the boolean mask is False, preserving order."""
+        count = int(np.count_nonzero(mask))
+        for field, buffer in self._buffers.items():
+            buffer[:count] = getattr(self, field)[mask]
+        self._resize(count)
+
+    def kick_drift(self, dt: float) -> None:
+        """Update velocities from acc_x/acc_y, then positions from the new velocities."""
+        kick_drift(self.pos_x, self.pos_y, self.vel_x, self.vel_y, self.acc_x, self.acc_y, dt)
+
+    def _allocate(self, capacity: int) -> None:
+        """Allocate zeroed backing buffers for capacity bodies."""
+        self._buffers = {field: np.zeros(capacity, dtype=dtype) for field, dtype in self._dtypes.items()}
+        self.capacity = capacity
+
+    def _resize(self, count: int) -> None:
+        """Point the public arrays at the first count entries of the buffers."""
+        self._count = count
+        for field, buffer in self._buffers.items():
+            setattr(self, field, buffer[:count])
@@ -2,10 +2,11 @@
 
 import math
 from typing import List, Tuple, Optional
-from ..bodies.celestial_body import CelestialBody
-from ..bodies.satellite import Satellite
+import numpy as np
 from ..bodies.celestial_body import CelestialBody
 from ..bodies.impact_marker import ImpactMarker
+from ..config import settings
+from .body_arrays import BodyArrays
 
 
 def distance_between_bodies(body1: CelestialBody, body2: CelestialBody) -> float:
@@ -17,40 +18,255 @@ def distance_between_bodies(body1: CelestialBody, body2: CelestialBody) -> float
 
 def check_collision(body1: CelestialBody, body2: CelestialBody) -> bool:
     """Check if two celestial bodies have collided."""
-    distance = distance_between_bodies(body1, body2)
-    # Collision occurs when distance is less than the sum of their radii
-    return distance <= (body1.radius_km + body2.radius_km)
+    # Collision occurs when distance is less than the sum of their radii;
+    # compare squared values so no square root is needed
+    radius_sum = body1.radius_km + body2.radius_km
+    return body1.distance_squared_to(body2) <= radius_sum * radius_sum
 
 
-def detect_collisions(bodies: List[CelestialBody]) -> List[Tuple[CelestialBody, CelestialBody]]:
-    """Detect all collisions between celestial bodies."""
-    collisions = []
+class CollisionBuffers:
+    """Reusable N x N scratch arrays for the brute-force collision search.
+
+    The arrays grow to the largest body count seen so far; smaller searches
+    work in the top-left corner, so steady-state frames allocate nothing.
+    """
+
+    def __init__(self):
+        self._allocate(0)
+
+    def _allocate(self, capacity: int) -> None:
+        """Allocate capacity x capacity buffers."""
+        self._dx = np.empty((capacity, capacity), dtype=np.float64)
+        self._dy = np.empty((capacity, capacity), dtype=np.float64)
+        self._radius_sum = np.empty((capacity, capacity), dtype=np.float64)
+        self._overlapping = np.empty((capacity, capacity), dtype=bool)
+        self.capacity = capacity
+
+    def get(self, rows: int, columns: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Get rows x columns views of the dx, dy, radius-sum and overlap buffers (square by default)."""
+        if columns is None:
+            columns = rows
+        size = max(rows, columns)
+        if size > self.capacity:
+            self._allocate(max(size, 2 * self.capacity))
+
+        return (self._dx[:rows, :columns], self._dy[:rows, :columns],
+                self._radius_sum[:rows, :columns], self._overlapping[:rows, :columns])
+
+
+def detect_collision_pairs(arrays: BodyArrays,
+                           buffers: Optional[CollisionBuffers] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Find the index pairs (i, j) with i < j of all overlapping bodies."""
+    if buffers is None:
+        buffers = CollisionBuffers()
+    distance_sq, dy, radius_sum, overlapping = buffers.get(len(arrays))
+
+    np.subtract.outer(arrays.pos_x, arrays.pos_x, out=distance_sq)
+    np.subtract.outer(arrays.pos_y, arrays.pos_y, out=dy)
+    np.multiply(distance_sq, distance_sq, out=distance_sq)
+    np.multiply(dy, dy, out=dy)
+    np.add(distance_sq, dy, out=distance_sq)
+
+    # Compare squared distances so no square root is needed per pair
+    np.add.outer(arrays.radius, arrays.radius, out=radius_sum)
+    np.square(radius_sum, out=radius_sum)
+    np.less_equal(distance_sq, radius_sum, out=overlapping)
+
+    # Keep only the upper triangle to skip self-pairs and duplicates
+    first_indices, second_indices = np.nonzero(overlapping)
+    upper = first_indices < second_indices
+    return first_indices[upper], second_indices[upper]
+
+
+def _expand_ranges(starts: np.ndarray, stops: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Flatten the index ranges [starts[k], stops[k]) into (owner k, index) pairs."""
+    counts = stops - starts
+    owners = np.repeat(np.arange(len(starts)), counts)
+    offsets = np.arange(len(owners)) - np.repeat(np.cumsum(counts) - counts, counts)
+    return owners, np.repeat(starts, counts) + offsets
+
+
+def detect_collision_pairs_split(arrays: BodyArrays, satellite_mask: np.ndarray,
+                                 buffers: Optional[CollisionBuffers] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the index pairs (i, j) with i < j of all overlapping bodies, treating satellites separately.
+
+    Every body is tested against the few large bodies (N x T instead of N x N),
+    and satellites are tested against each other with a sort-and-sweep along x:
+    their radii are tiny, so almost no satellite has a neighbour inside its window.
+    """
+    if buffers is None:
+        buffers = CollisionBuffers()
+    targets = np.flatnonzero(~satellite_mask)
+    distance_sq, dy, radius_sum, overlapping = buffers.get(len(arrays), len(targets))
+
+    # Every body against every target
+    np.subtract.outer(arrays.pos_x, arrays.pos_x[targets], out=distance_sq)
+    np.subtract.outer(arrays.pos_y, arrays.pos_y[targets], out=dy)
+    np.multiply(distance_sq, distance_sq, out=distance_sq)
+    np.multiply(dy, dy, out=dy)
+    np.add(distance_sq, dy, out=distance_sq)
+    np.add.outer(arrays.radius, arrays.radius[targets], out=radius_sum)
+    np.square(radius_sum, out=radius_sum)
+    np.less_equal(distance_sq, radius_sum, out=overlapping)
+
+    rows, columns = np.nonzero(overlapping)
+    columns = targets[columns]
+    # Target-target pairs appear twice; satellite-target pairs only once
+    keep = satellite_mask[rows] | (rows < columns)
+    rows = rows[keep]
+    columns = columns[keep]
+    first_parts = [np.minimum(rows, columns)]
+    second_parts = [np.maximum(rows, columns)]
+
+    # Satellites against each other: sort by x and only test within reach
+    satellites = np.flatnonzero(satellite_mask)
+    if len(satellites) > 1:
+        order = satellites[np.argsort(arrays.pos_x[satellites], kind="stable")]
+        xs = arrays.pos_x[order]
+        reach = arrays.radius[order] + arrays.radius[order].max()
+        starts = np.arange(1, len(order) + 1)
+        stops = np.searchsorted(xs, xs + reach, side="right")
+        if (stops > starts).any():
+            lefts, rights = _expand_ranges(starts, stops)
+            first = order[lefts]
+            second = order[rights]
+            dx = arrays.pos_x[first] - arrays.pos_x[second]
+            dy_pairs = arrays.pos_y[first] - arrays.pos_y[second]
+            radius_pairs = arrays.radius[first] + arrays.radius[second]
+            hit = dx * dx + dy_pairs * dy_pairs <= radius_pairs * radius_pairs
+            first_parts.append(np.minimum(first[hit], second[hit]))
+            second_parts.append(np.maximum(first[hit], second[hit]))
+
+    # Match the row-major order of the brute-force search
+    first_indices = np.concatenate(first_parts)
+    second_indices = np.concatenate(second_parts)
+    order = np.lexsort((second_indices, first_indices))
+    return first_indices[order], second_indices[order]
 
-    # Check all pairs of bodies for collisions
-    for i, body1 in enumerate(bodies):
-        for j, body2 in enumerate(bodies):
-            if i >= j:  # Avoid checking the same pair twice and self-collision
-                continue
 
-            if check_collision(body1, body2):
-                # Determine which body should be removed based on mass
-                if should_body_survive_collision(body1, body2):
-                    collisions.append((body2, body1))  # body2 gets destroyed, impacts body1
-                else:
-                    collisions.append((body1, body2))  # body1 gets destroyed, impacts body2
+def detect_collision_pairs_grid(arrays: BodyArrays) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the index pairs (i, j) with i < j of all overlapping bodies using a uniform grid.
+
+    Bodies are bucketed into square cells twice the largest radius wide, so two
+    overlapping bodies always share a cell or sit in adjacent cells. Only those
+    neighbours get the exact squared-distance test. Bucketing and neighbour
+    lookup are done with sorting and binary search over whole arrays.
+    """
+    cell_size = 2.0 * float(arrays.radius.max()) if len(arrays) else 0.0
+    if cell_size <= 0.0:
+        # Point-sized bodies only collide when coincident; no grid needed
+        return detect_collision_pairs(arrays)
+
+    cells_x = np.floor(arrays.pos_x / cell_size).astype(np.int64)
+    cells_y = np.floor(arrays.pos_y / cell_size).astype(np.int64)
+
+    # Number the occupied rows and columns so a cell key fits in N * N
+    columns = np.unique(cells_x)
+    rows = np.unique(cells_y)
+    keys = np.searchsorted(columns, cells_x) * len(rows) + np.searchsorted(rows, cells_y)
+
+    # Bodies grouped by cell: occupied cell k holds by_cell[cell_starts[k]:cell_stops[k]]
+    by_cell = np.argsort(keys, kind="stable")
+    cell_keys, cell_starts, cell_counts = np.unique(keys[by_cell], return_index=True, return_counts=True)
+    cell_stops = cell_starts + cell_counts
+
+    # Walk the bodies in cell order so the binary searches below get sorted queries
+    cells_x = cells_x[by_cell]
+    cells_y = cells_y[by_cell]
+
+    def neighbours(cells, occupied, offset):
+        """Index into occupied of each body's neighbouring row/column, and whether it exists."""
+        index = np.searchsorted(occupied, cells + offset)
+        found = index < len(occupied)
+        found[found] = occupied[index[found]] == cells[found] + offset
+        return index, found
+
+    row_neighbours = [neighbours(cells_y, rows, offset) for offset in (-1, 0, 1)]
+    first_parts = []
+    second_parts = []
+    for offset_x in (-1, 0, 1):
+        neighbour_columns, column_found = neighbours(cells_x, columns, offset_x)
+        for neighbour_rows, row_found in row_neighbours:
+            bodies = np.flatnonzero(column_found & row_found)
+            neighbour_keys = neighbour_columns[bodies] * len(rows) + neighbour_rows[bodies]
+
+            # The neighbouring cell may be empty even when its row and column are not
+            cells = np.searchsorted(cell_keys, neighbour_keys)
+            occupied = cells < len(cell_keys)
+            occupied[occupied] = cell_keys[cells[occupied]] == neighbour_keys[occupied]
+            bodies = bodies[occupied]
+            cells = cells[occupied]
+
+            # Every body in the neighbouring cell is a candidate
+            owners, positions = _expand_ranges(cell_starts[cells], cell_stops[cells])
+            first = by_cell[bodies[owners]]
+            second = by_cell[positions]
+
+            # Each unordered pair is seen from both cells; keep it once
+            keep = first < second
+            first = first[keep]
+            second = second[keep]
+            dx = arrays.pos_x[first] - arrays.pos_x[second]
+            dy = arrays.pos_y[first] - arrays.pos_y[second]
+            radius_sum = arrays.radius[first] + arrays.radius[second]
+            hit = dx * dx + dy * dy <= radius_sum * radius_sum
+            first_parts.append(first[hit])
+            second_parts.append(second[hit])
+
+    # Match the row-major order of the brute-force search
+    first_indices = np.concatenate(first_parts)
+    second_indices = np.concatenate(second_parts)
+    order = np.lexsort((second_indices, first_indices))
+    return first_indices[order], second_indices[order]
+
+
+def detect_collision_indices(bodies: List[CelestialBody], arrays: Optional[BodyArrays] = None,
+                             buffers: Optional[CollisionBuffers] = None) -> List[Tuple[int, int]]:
+    """Detect all collisions as (destroyed index, target index) pairs into bodies."""
+    if arrays is None:
+        arrays = BodyArrays(bodies)
+
+    satellite_mask = arrays.satellite != 0.0
+    target_count = len(arrays) - int(np.count_nonzero(satellite_mask))
+
+    # The grid broad phase only pays off once there are enough large bodies to spread out
+    if target_count >= settings.COLLISION_GRID_MIN_BODIES:
+        first_indices, second_indices = detect_collision_pairs_grid(arrays)
+    elif target_count < len(arrays):
+        # Satellites only need testing against the large bodies and, cheaply, each other
+        first_indices, second_indices = detect_collision_pairs_split(arrays, satellite_mask, buffers)
+    else:
+        first_indices, second_indices = detect_collision_pairs(arrays, buffers)
+
+    collisions = []
+    for i, j in zip(first_indices.tolist(), second_indices.tolist()):
+        # Determine which body should be removed based on mass
+        if should_body_survive_collision(bodies[i], bodies[j]):
+            collisions.append((j, i))  # body j gets destroyed, impacts body i
+        else:
+            collisions.append((i, j))  # body i gets destroyed, impacts body j
 
     return collisions
 
 
+def detect_collisions(bodies: List[CelestialBody], arrays: Optional[BodyArrays] = None,
+                      buffers: Optional[CollisionBuffers] = None) -> List[Tuple[CelestialBody, CelestialBody]]:
+    """Detect all collisions between celestial bodies as (destroyed, target) pairs."""
+    return [(bodies[destroyed], bodies[target])
+            for destroyed, target in detect_collision_indices(bodies, arrays, buffers)]
+
+
 def should_body_survive_collision(body1: CelestialBody, body2: CelestialBody) -> bool:
     """Determine if body1 should survive a collision with body2."""
-    # Earth and Moon are "immovable" - they always survive unless hit by something much larger
-    if body1.name == 'Earth' or body1.name == 'Moon':
-        # Earth/Moon survive unless hit by something 10x more massive
+    # Immovable bodies (Earth, Moon) always survive unless hit by something much larger
+    if body1.immovable:
+        # Survive unless hit by something 10x more massive
         return body2.mass_kg < body1.mass_kg * 10
 
-    if body2.name == 'Earth' or body1.name == 'Moon':
-        # Earth/Moon survive unless hit by something 10x more massive
+    if body2.immovable:
+        # Survive unless hit by something 10x more massive
         return body1.mass_kg < body2.mass_kg * 10
 
     # For other bodies, the more massive one survives
@@ -66,16 +282,17 @@ def create_impact_marker(colliding_body: CelestialBody, target: CelestialBody) -
     # Calculate the impact point on the surface of the target body
     dx = colliding_body.x_position - target.x_position
     dy = colliding_body.y_position - target.y_position
-    distance = math.sqrt(dx * dx + dy * dy)
+    distance_sq = dx * dx + dy * dy
 
-    if distance == 0:
+    if distance_sq == 0:
         # Body is exactly at the center, place marker at arbitrary point on surface
         impact_x = target.x_position + target.radius_km
         impact_y = target.y_position
     else:
         # Normalize the direction vector and place marker on the surface
-        unit_x = dx / distance
-        unit_y = dy / distance
+        inv_distance = 1.0 / math.sqrt(distance_sq)
+        unit_x = dx * inv_distance
+        unit_y = dy * inv_distance
         impact_x = target.x_position + unit_x * target.radius_km
         impact_y = target.y_position + unit_y * target.radius_km
 
@@ -1,8 +1,15 @@
 """Physics calculations for the solar system simulation."""
 
 import math
-from typing import List, Tuple
+from itertools import combinations
+import numpy as np
+from typing import List, Optional, Tuple
 from ..bodies.celestial_body import CelestialBody
+from ..config import settings
+from .barnes_hut import QuadTree
+from .body_arrays import BodyArrays, field_dtype
+from .gravity_cuda import CUDA_AVAILABLE, CudaGravityBuffers
+from ._kernels import JIT_AVAILABLE, THREAD_COUNT, pairwise_gravity, pairwise_gravity_parallel
 
 
 # Gravitational constant (adjusted for km, kg, s units)
@@ -19,18 +26,16 @@ def calculate_gravitational_force(body1: CelestialBody, body2: CelestialBody) ->
     # Calculate distance vector
     dx = body2.x_position - body1.x_position
     dy = body2.y_position - body1.y_position
-    distance = math.sqrt(dx**2 + dy**2)
+    distance_sq = dx * dx + dy * dy
 
     # Avoid division by zero
-    if distance == 0:
+    if distance_sq == 0:
         return (0.0, 0.0)
 
-    # Calculate gravitational force magnitude
-    force_magnitude = G * body1.mass_kg * body2.mass_kg / (distance**2)
-
-    # Calculate force components (unit vector * magnitude)
-    fx = force_magnitude * dx / distance
-    fy = force_magnitude * dy / distance
+    # Force magnitude G*m1*m2/r^2 times the unit vector d/r, folded into one factor
+    scale = G * body1.mass_kg * body2.mass_kg / (distance_sq * math.sqrt(distance_sq))
+    fx = scale * dx
+    fy = scale * dy
 
     return (fx, fy)
 
@@ -66,17 +71,18 @@ def apply_gravitational_forces(bodies: List[CelestialBody], dt: float) -> None:
         bodies: List of all celestial bodies in the simulation
         dt: Time step in seconds
     """
-    # Calculate forces for each body
-    forces = []
-    for body in bodies:
-        other_bodies = [b for b in bodies if b != body]
-        fx, fy = calculate_total_force(body, other_bodies)
-        forces.append((fx, fy))
+    # Calculate forces once per pair; the second body feels the opposite force
+    forces_x = [0.0] * len(bodies)
+    forces_y = [0.0] * len(bodies)
+    for i, j in combinations(range(len(bodies)), 2):
+        fx, fy = calculate_gravitational_force(bodies[i], bodies[j])
+        forces_x[i] += fx
+        forces_y[i] += fy
+        forces_x[j] -= fx
+        forces_y[j] -= fy
 
     # Apply forces to update velocities
-    for i, body in enumerate(bodies):
-        fx, fy = forces[i]
-
+    for body, fx, fy in zip(bodies, forces_x, forces_y):
         # F = ma, so a = F/m
         ax = fx / body.mass_kg
         ay = fy / body.mass_kg
@@ -84,3 +90,59 @@ def apply_gravitational_forces(bodies: List[CelestialBody], dt: float) -> None:
         # Update velocities: v = v0 + at
         body.x_velocity += ax * dt
         body.y_velocity += ay * dt
+
+
+def compute_gravitational_accelerations(arrays: BodyArrays, softening_km: float = 0.0,
+                                        tree: Optional[QuadTree] = None,
+                                        gpu: Optional[CudaGravityBuffers] = None) -> None:
+    """
+    Write the gravitational acceleration of every body into arrays.acc_x/acc_y.
+
+    Args:
+        arrays: Structure-of-arrays state of all bodies in the simulation
+        softening_km: Softening length added to every pair distance
+        tree: Quadtree to rebuild for the Barnes-Hut walk, reusing its node arrays
+        gpu: Pinned and device buffers to reuse for the CUDA direct sum
+    """
+    soft2 = softening_km * softening_km
+    count = len(arrays)
+    # An exact direct sum on the GPU outpaces both CPU paths once the copies are amortized
+    if CUDA_AVAILABLE and count >= settings.GPU_GRAVITY_MIN_BODIES:
+        if gpu is None:
+            gpu = CudaGravityBuffers()
+        gpu.accelerations(arrays.pos_x, arrays.pos_y, arrays.mass, arrays.acc_x, arrays.acc_y, G, soft2)
+    # The tree walk only beats the direct sum when compiled and with many bodies
+    elif JIT_AVAILABLE and count >= settings.BARNES_HUT_MIN_BODIES:
+        if tree is None:
+            tree = QuadTree()
+        tree.build(arrays.pos_x, arrays.pos_y, arrays.mass)
+        tree.accelerations(arrays.acc_x, arrays.acc_y, G, settings.BARNES_HUT_THETA, soft2)
+    else:
+        # Starting the thread pool costs more than it saves for a handful of bodies, and the
+        # parallel kernel evaluates every pair twice, so it needs more than two threads to win
+        use_threads = THREAD_COUNT > 2 and count >= settings.PARALLEL_GRAVITY_MIN_BODIES
+        kernel = pairwise_gravity_parallel if use_threads else pairwise_gravity
+        kernel(arrays.pos_x, arrays.pos_y, arrays.mass, arrays.acc_x, arrays.acc_y, G, soft2)
+
+
+def warm_up_kernels() -> None:
+    """
+    Compile (or load from the on-disk cache) every gravity kernel up front.
+
+    Numba compiles a kernel the first time it runs, so without this the
+    parallel and Barnes-Hut kernels would stall a frame mid-simulation when
+    the body count first crosses their thresholds.
+    """
+    if not JIT_AVAILABLE:
+        return
+    pos_x = np.array([0.0, 1.0])
+    pos_y = np.array([0.0, 1.0])
+    # Masses in the dtype BodyArrays stores them in, so the signatures compiled are the ones used
+    mass = np.ones(2, dtype=field_dtype("mass"))
+    acc_x = np.empty(2)
+    acc_y = np.empty(2)
+    for kernel in (pairwise_gravity, pairwise_gravity_parallel):
+        kernel(pos_x, pos_y, mass, acc_x, acc_y, G, 0.0)
+    QuadTree(pos_x, pos_y, mass).accelerations(acc_x, acc_y, G, settings.BARNES_HUT_THETA)
+    if CUDA_AVAILABLE:
+        CudaGravityBuffers().accelerations(pos_x, pos_y, mass, acc_x, acc_y, G, 0.0)
@@ -0,0 +1,109 @@
+"""Direct-sum gravity on a CUDA GPU.
+
+Numba's CUDA support and a CUDA-capable GPU are both optional. When either
+is missing CUDA_AVAILABLE is False and the CPU kernels are used instead.
+"""
+
+import math
+import numpy as np
+
+try:
+    from numba import cuda, float64
+    CUDA_AVAILABLE = cuda.is_available()
+except ImportError:
+    cuda = None
+    CUDA_AVAILABLE = False
+
+# Bodies per thread block, and per tile of source bodies staged in shared memory
+THREADS_PER_BLOCK = 128
+
+
+if cuda is not None:
+
+    @cuda.jit(fastmath=True)
+    def _gravity_kernel(pos_x, pos_y, mass, acc_x, acc_y, G, soft2):
+        """One thread per target body, summing the pull of every body tile by tile."""
+        tile_x = cuda.shared.array(THREADS_PER_BLOCK, float64)
+        tile_y = cuda.shared.array(THREADS_PER_BLOCK, float64)
+        tile_mass = cuda.shared.array(THREADS_PER_BLOCK, float64)
+
+        n = pos_x.shape[0]
+        thread = cuda.threadIdx.x
+        i = cuda.grid(1)
+        x = pos_x[i] if i < n else 0.0
+        y = pos_y[i] if i < n else 0.0
+        ax = 0.0
+        ay = 0.0
+
+        for tile_start in range(0, n, THREADS_PER_BLOCK):
+            # Each thread stages one source body; padding past the end has no mass
+            j = tile_start + thread
+            if j < n:
+                tile_x[thread] = pos_x[j]
+                tile_y[thread] = pos_y[j]
+                tile_mass[thread] = mass[j]
+            else:
+                tile_x[thread] = 0.0
+                tile_y[thread] = 0.0
+                tile_mass[thread] = 0.0
+            cuda.syncthreads()
+
+            for k in range(THREADS_PER_BLOCK):
+                dx = tile_x[k] - x
+                dy = tile_y[k] - y
+                distance_sq = dx * dx + dy * dy + soft2
+                # Self-interaction and coincident bodies exert no force
+                if distance_sq > 0.0:
+                    inv_distance_cubed = 1.0 / (distance_sq * math.sqrt(distance_sq))
+                    pull = tile_mass[k] * inv_distance_cubed
+                    ax += pull * dx
+                    ay += pull * dy
+            cuda.syncthreads()
+
+        if i < n:
+            acc_x[i] = G * ax
+            acc_y[i] = G * ay
+
+
+class CudaGravityBuffers:
+    """Pinned host and device arrays for the GPU kernel, reused while the body count fits."""
+
+    def __init__(self):
+        self.capacity = 0
+        self._stream = None
+
+    def _allocate(self, capacity: int) -> None:
+        """Allocate pinned host staging arrays and device arrays for capacity bodies."""
+        self._host = {name: cuda.pinned_array(capacity, dtype=np.float64)
+                      for name in ("pos_x", "pos_y", "mass", "acc_x", "acc_y")}
+        self._device = {name: cuda.device_array(capacity, dtype=np.float64) for name in self._host}
+        self._stream = cuda.stream()
+        self.capacity = capacity
+
+    def accelerations(self, pos_x: np.ndarray, pos_y: np.ndarray, mass: np.ndarray,
+                      acc_x: np.ndarray, acc_y: np.ndarray, G: float, soft2: float) -> None:
+        """Write the gravitational acceleration of every body into acc_x/acc_y."""
+        count = len(pos_x)
+        if count == 0:
+            return
+        if count > self.capacity:
+            self._allocate(max(count, 2 * self.capacity))
+
+        host = self._host
+        device = {name: array[:count] for name, array in self._device.items()}
+        stream = self._stream
+
+        # Copies from pinned memory run asynchronously on the stream
+        for name, values in (("pos_x", pos_x), ("pos_y", pos_y), ("mass", mass)):
+            host[name][:count] = values
+            device[name].copy_to_device(host[name][:count], stream=stream)
+
+        blocks = (count + THREADS_PER_BLOCK - 1) // THREADS_PER_BLOCK
+        _gravity_kernel[blocks, THREADS_PER_BLOCK, stream](
+            device["pos_x"], device["pos_y"], device["mass"], device["acc_x"], device["acc_y"], G, soft2)
+
+        device["acc_x"].copy_to_host(host["acc_x"][:count], stream=stream)
+        device["acc_y"].copy_to_host(host["acc_y"][:count], stream=stream)
+        stream.synchronize()
+        acc_x[:] = host["acc_x"][:count]
+        acc_y[:] = host["acc_y"][:count]
@@ -2,15 +2,21 @@
 
 import pygame
 import sys
-from typing import List
+from collections import deque
+from itertools import compress
+from math import ceil, hypot
+import numpy as np
+from typing import Deque, Dict, List, Tuple
 from .graphics.renderer import Renderer
 from .audio.audio_manager import AudioManager
 from .config.settings_manager import SettingsManager
-from .physics.gravity import apply_gravitational_forces
-from .physics.collision import detect_collisions, create_impact_marker
+from .physics.body_arrays import BodyArrays
+from .physics.barnes_hut import QuadTree
+from .physics.gravity import compute_gravitational_accelerations, warm_up_kernels
+from .physics.gravity_cuda import CudaGravityBuffers
+from .physics.collision import CollisionBuffers, detect_collision_indices, create_impact_marker
 from .bodies.celestial_body import CelestialBody
 from .bodies.satellite import Satellite
-from .bodies.celestial_body import CelestialBody
 from .bodies.impact_marker import ImpactMarker
 from .graphics.input_dialog import get_text_input
 from .scenarios.predefined_systems import (
@@ -19,12 +25,20 @@ from .scenarios.predefined_systems import (
     create_jupiter_system,
     create_proxima_centauri_system,
     create_empty_system,
-    # Import predefined bodies
-    earth, moon, iss, sun, mercury, venus, mars, jupiter, saturn, uranus, neptune,
-    jupiter_center, io, europa, ganymede, callisto, proxima, proxima_b, proxima_c, proxima_d
+    PREDEFINED_BODIES
 )
 from .config import settings
-from .config.settings import *
+
+# Events the simulation never handles; the mouse position is sampled instead of tracked
+IGNORED_EVENTS = [
+    pygame.MOUSEMOTION,
+    pygame.FINGERMOTION,
+    pygame.JOYAXISMOTION,
+    pygame.JOYBALLMOTION,
+    pygame.JOYHATMOTION,
+    pygame.CONTROLLERAXISMOTION,
+    pygame.KEYUP,
+]
 
 
 class SolarSystemSimulation:
@@ -35,10 +49,17 @@ class SolarSystemSimulation:
         self.settings_manager = SettingsManager()
         self.renderer = Renderer()
         self.audio_manager = AudioManager()
+        # Font for the on-screen HUD text, looked up once
+        self._hud_font = self.renderer.get_font('red_alert_small')
+        self._instructions_surface = self._build_instruction_surface()
+        # Last rendered text of each HUD line, re-rendered only when its text changes
+        self._hud_text_cache: Dict[str, Tuple[str, pygame.Surface]] = {}
         self.bodies: List[CelestialBody] = []
-        self.impact_markers: List[ImpactMarker] = []
+        # Only the most recent impacts are kept, so drawing them stays bounded
+        self.impact_markers: Deque[ImpactMarker] = deque(maxlen=settings.MAX_IMPACT_MARKERS)
         self.running = True
         self.paused = False
+        self._render_dirty = True  # Set when the paused frame must be redrawn
         self.scenario = scenario
 
         # Menu state system
@@ -102,6 +123,54 @@ class SolarSystemSimulation:
         self.current_time_scale_index = self.time_scale_values.index(1)  # Default to 1x (normal speed)
         self.time_scale = self.time_scale_values[self.current_time_scale_index]
 
+        # Mouse position is sampled once per frame, so motion and other unused
+        # high-frequency events are dropped before they reach the queue
+        pygame.event.set_blocked(IGNORED_EVENTS)
+
+        # Event and game-control key handlers, looked up once per event
+        self._event_handlers = {
+            pygame.QUIT: self._on_quit,
+            pygame.MOUSEWHEEL: self._on_mouse_wheel,
+            pygame.MOUSEBUTTONDOWN: self._on_mouse_button_down,
+            pygame.MOUSEBUTTONUP: self._on_mouse_button_up,
+            pygame.KEYDOWN: self._on_key_down,
+            pygame.VIDEORESIZE: self._on_video_resize,
+            pygame.WINDOWEXPOSED: self._on_window_exposed,
+        }
+        self._handled_events = list(self._event_handlers)
+        self._key_handlers = {
+            pygame.K_SPACE: self._toggle_pause,
+            pygame.K_p: self._toggle_pause,
+            pygame.K_r: self._reset_simulation,
+            pygame.K_l: self._toggle_labels,
+            pygame.K_t: self._toggle_trails,
+            pygame.K_c: self._clear_trails_and_impacts,
+            pygame.K_m: self.audio_manager.toggle_mute,
+            pygame.K_PLUS: self._zoom_in,
+            pygame.K_EQUALS: self._zoom_in,
+            pygame.K_MINUS: self._zoom_out,
+            pygame.K_PERIOD: self._speed_up_time,
+            pygame.K_GREATER: self._speed_up_time,
+            pygame.K_COMMA: self._slow_down_time,
+            pygame.K_LESS: self._slow_down_time,
+            pygame.K_F11: self._toggle_fullscreen,
+            pygame.K_ESCAPE: self._open_menu,
+            pygame.K_q: self._quit,
+        }
+        # Window size of the latest resize event this frame, applied once all events are handled
+        self._pending_resize = None
+
+        # Scratch arrays reused by collision detection every frame
+        self._collision_buffers = CollisionBuffers()
+        # Barnes-Hut node arrays reused by every physics step
+        self._gravity_tree = QuadTree()
+        # Pinned host and device arrays reused by the GPU gravity path
+        self._gravity_gpu = CudaGravityBuffers()
+        # Compile the gravity kernels now rather than in the middle of a frame
+        warm_up_kernels()
+        # Physics state of the bodies, kept in step with self.bodies across frames
+        self.body_arrays = BodyArrays([])
+
         # Time tracking
         self.simulation_time_elapsed = 0.0  # Total simulation time in seconds
         self.real_time_start = pygame.time.get_ticks()  # Start time in milliseconds
@@ -137,12 +206,20 @@ class SolarSystemSimulation:
             self.bodies = create_earth_moon_system()
             self.total_satellites_created = 1
 
+        # Reload the physics state, reusing its buffers across resets and scenario switches
+        self.body_arrays.load(self.bodies)
+
+    def add_body(self, body: CelestialBody) -> None:
+        """Add a body to the simulation."""
+        self.bodies.append(body)
+        self.body_arrays.append(body)
+
     def switch_scenario(self, new_scenario: str) -> None:
         """Switch to a new scenario and reset the simulation."""
         self.scenario = new_scenario
         self._setup_bodies()
         self.impact_markers.clear()
-        self.renderer.trails.clear()
+        self.renderer.clear_trails()
         self.renderer.reset_camera_and_zoom()  # Reset camera position and zoom
         self.simulation_time_elapsed = 0.0
         self.real_time_start = pygame.time.get_ticks()
@@ -268,7 +345,7 @@ class SolarSystemSimulation:
                 self.menu_state = "controls"
                 self.menu_selection = 0
             elif option == "Resume":
-                self.menu_open = False
+                self._close_menu()
                 self.paused = False
             elif option == "Quit":
                 self.running = False
@@ -276,7 +353,7 @@ class SolarSystemSimulation:
         elif self.menu_state == "scenario":
             selected_scenario = self.available_scenarios[self.menu_selection]
             self.switch_scenario(selected_scenario)
-            self.menu_open = False
+            self._close_menu()
             self.paused = False
 
         elif self.menu_state == "settings":
@@ -321,7 +398,7 @@ class SolarSystemSimulation:
     def _go_back_menu(self) -> None:
         """Handle ESC key in menus (go back)."""
         if self.menu_state == "main":
-            self.menu_open = False
+            self._close_menu()
             # Don't change pause state when closing menu
         elif self.menu_state == "scenario":
             self.menu_state = "main"
@@ -365,8 +442,6 @@ class SolarSystemSimulation:
         Returns:
             Velocity in km/s with exponential scaling
         """
-        import math
-
         # Minimum drag distance for any velocity (prevents division by zero)
         min_drag = 5.0
 
@@ -399,7 +474,7 @@ class SolarSystemSimulation:
         drag_vector_y = end_pos[1] - start_pos[1]
 
         # Calculate magnitude of drag
-        drag_magnitude = (drag_vector_x**2 + drag_vector_y**2)**0.5
+        drag_magnitude = hypot(drag_vector_x, drag_vector_y)
 
         if drag_magnitude == 0:
             return 0.0
@@ -407,26 +482,11 @@ class SolarSystemSimulation:
         # Calculate what the velocity would be with exponential scaling
         velocity_x = self._calculate_exponential_velocity(drag_vector_x)
         velocity_y = self._calculate_exponential_velocity(drag_vector_y)
-        velocity_magnitude = (velocity_x**2 + velocity_y**2)**0.5
+        velocity_magnitude = hypot(velocity_x, velocity_y)
 
         # Return the equivalent linear scale for this drag distance
         return velocity_magnitude / drag_magnitude
 
-    def _create_satellite_at_position(self, x: float, y: float) -> None:
-        """Create a new satellite at the given world coordinates with zero velocity."""
-        # Increment counter for unique naming
-        self.total_satellites_created += 1
-
-        new_satellite = Satellite(
-            name=f"Satellite-{self.total_satellites_created}",
-            x_position=x,
-            y_position=y,
-            x_velocity=0,  # Zero initial velocity as requested
-            y_velocity=0,
-        )
-        self.bodies.append(new_satellite)
-        print(f"Created {new_satellite.name} at position ({x:.1f}, {y:.1f}) km")
-
     def _create_satellite_from_drag(self) -> None:
         """Create a satellite from drag operation with calculated velocity."""
         if not self.satellite_drag_start_pos or not self.satellite_drag_current_pos:
@@ -447,17 +507,12 @@ class SolarSystemSimulation:
         # Increment counter for unique naming
         self.total_satellites_created += 1
 
-        new_satellite = Satellite(
-            name=f"Satellite-{self.total_satellites_created}",
-            x_position=world_x,
-            y_position=world_y,
-            x_velocity=velocity_x,
-            y_velocity=velocity_y,
-        )
-        self.bodies.append(new_satellite)
+        new_satellite = Satellite.from_state(
+            f"Satellite-{self.total_satellites_created}", world_x, world_y, velocity_x, velocity_y)
+        self.add_body(new_satellite)
 
         # Calculate speed for display
-        speed = (velocity_x**2 + velocity_y**2)**0.5
+        speed = hypot(velocity_x, velocity_y)
         print(f"Created {new_satellite.name} at ({world_x:.1f}, {world_y:.1f}) km with velocity ({velocity_x:.2f}, {velocity_y:.2f}) km/s (speed: {speed:.2f} km/s)")
 
     def _create_custom_body_from_drag(self) -> None:
@@ -482,45 +537,25 @@ class SolarSystemSimulation:
                 return
 
             # Check if the name matches a predefined body
-            predefined_bodies = {
-                "earth": earth,
-                "moon": moon,
-                "iss": iss,
-                "sun": sun,
-                "mercury": mercury,
-                "venus": venus,
-                "mars": mars,
-                "jupiter": jupiter,
-                "saturn": saturn,
-                "uranus": uranus,
-                "neptune": neptune,
-                "io": io,
-                "europa": europa,
-                "ganymede": ganymede,
-                "callisto": callisto,
-                "proxima": proxima,
-                "proxima b": proxima_b,
-                "proxima c": proxima_c,
-                "proxima d": proxima_d
-            }
-
-            if name.lower() in predefined_bodies:
+            if name.lower() in PREDEFINED_BODIES:
                 # Use predefined body but with drag position and velocity
-                template_body = predefined_bodies[name.lower()]
+                (template_name, template_radius_km, template_mass_kg,
+                 template_color, template_immovable) = PREDEFINED_BODIES[name.lower()]
                 new_body = CelestialBody(
-                    name=template_body.name,
-                    radius_km=template_body.radius_km,
-                    mass_kg=template_body.mass_kg,
+                    name=template_name,
+                    radius_km=template_radius_km,
+                    mass_kg=template_mass_kg,
                     x_position=world_x,
                     y_position=world_y,
                     x_velocity=velocity_x,
                     y_velocity=velocity_y,
-                    color=template_body.color
+                    color=template_color,
+                    immovable=template_immovable
                 )
-                self.bodies.append(new_body)
+                self.add_body(new_body)
 
                 # Calculate speed for display
-                speed = (velocity_x**2 + velocity_y**2)**0.5
+                speed = hypot(velocity_x, velocity_y)
                 print(f"Created predefined body {new_body.name} at ({world_x:.1f}, {world_y:.1f}) km")
                 print(f"  Mass: {new_body.mass_kg:.2e} kg, Radius: {new_body.radius_km:.1f} km")
                 print(f"  Velocity: ({velocity_x:.2f}, {velocity_y:.2f}) km/s (speed: {speed:.2f} km/s)")
@@ -549,10 +584,10 @@ class SolarSystemSimulation:
                 y_velocity=velocity_y,
                 color=(255, 100, 100)  # Red-ish color for custom bodies
             )
-            self.bodies.append(new_body)
+            self.add_body(new_body)
 
             # Calculate speed for display
-            speed = (velocity_x**2 + velocity_y**2)**0.5
+            speed = hypot(velocity_x, velocity_y)
             print(f"Created {new_body.name} at ({world_x:.1f}, {world_y:.1f}) km")
             print(f"  Mass: {mass_kg:.2e} kg, Radius: {radius_km:.1f} km")
             print(f"  Velocity: ({velocity_x:.2f}, {velocity_y:.2f}) km/s (speed: {speed:.2f} km/s)")
@@ -564,201 +599,303 @@ class SolarSystemSimulation:
 
     def handle_events(self) -> None:
         """Handle pygame events."""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-            elif event.type == pygame.MOUSEWHEEL:
-                # Handle zoom
-                self.renderer.handle_zoom_event(event, self._clear_collision_markers)
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                keys = pygame.key.get_pressed()
-                if event.button == 1:  # Left mouse button
-                    if keys[pygame.K_LSHIFT] or keys[pygame.K_RSHIFT]:  # Shift + left click = camera pan
-                        self.is_panning_camera = True
-                        self.camera_pan_start_pos = event.pos
-                        self.camera_pan_last_pos = event.pos
-                    else:  # Regular left click = custom body
-                        self.is_dragging_body = True
-                        self.body_drag_start_pos = event.pos
-                        self.body_drag_current_pos = event.pos
-                elif event.button == 3:  # Right mouse button - satellite
-                    self.is_dragging_satellite = True
-                    self.satellite_drag_start_pos = event.pos
-                    self.satellite_drag_current_pos = event.pos
-            elif event.type == pygame.MOUSEBUTTONUP:
-                if event.button == 1:  # Left mouse button release
-                    if self.is_panning_camera:
-                        # End camera panning
-                        self.is_panning_camera = False
-                        self.camera_pan_start_pos = None
-                        self.camera_pan_last_pos = None
-                    elif self.is_dragging_body:
-                        # End dragging and create custom body with input dialog
-                        self._create_custom_body_from_drag()
-                        self.is_dragging_body = False
-                        self.body_drag_start_pos = None
-                        self.body_drag_current_pos = None
-                elif event.button == 3 and self.is_dragging_satellite:  # Right mouse button release
-                    # End dragging and create satellite
-                    self._create_satellite_from_drag()
-                    self.is_dragging_satellite = False
-                    self.satellite_drag_start_pos = None
-                    self.satellite_drag_current_pos = None
-            elif event.type == pygame.MOUSEMOTION:
-                if self.is_panning_camera:
-                    # Calculate camera movement based on mouse delta
-                    if self.camera_pan_last_pos:
-                        delta_x = event.pos[0] - self.camera_pan_last_pos[0]
-                        delta_y = event.pos[1] - self.camera_pan_last_pos[1]
-                        # Move camera in opposite direction of mouse movement
-                        self.renderer.move_camera(-delta_x, -delta_y, self._clear_collision_markers)
-                    self.camera_pan_last_pos = event.pos
-                elif self.is_dragging_satellite:
-                    self.satellite_drag_current_pos = event.pos
-                elif self.is_dragging_body:
-                    self.body_drag_current_pos = event.pos
-            elif event.type == pygame.KEYDOWN:
-                if self.menu_open:
-                    # Handle menu navigation based on current menu state
-                    self._handle_menu_input(event.key)
-                else:
-                    # Handle normal game controls
-                    if event.key == pygame.K_SPACE:
-                        self.paused = not self.paused
-                    elif event.key == pygame.K_p:
-                        self.paused = not self.paused
-                    elif event.key == pygame.K_r:
-                        self._setup_bodies()  # Reset simulation
-                        self.impact_markers.clear()  # Clear impact markers
-                        self.renderer.trails.clear()  # Clear trails
-                        self.renderer.reset_camera_and_zoom()  # Reset camera position and zoom
-                        self.simulation_time_elapsed = 0.0  # Reset elapsed time
-                        self.real_time_start = pygame.time.get_ticks()  # Reset real time tracker
-                        self.audio_manager.play_scenario_music(self.scenario)  # Restart music
-                        # Note: _setup_bodies() already resets total_satellites_created to 1
-                    elif event.key == pygame.K_l:
-                        # Toggle labels
-                        self.settings_manager.set("show_labels", not self.settings_manager.get("show_labels"))
-                        settings.SHOW_LABELS = self.settings_manager.get("show_labels")
-                        print(f"Labels {'enabled' if settings.SHOW_LABELS else 'disabled'}")
-                    elif event.key == pygame.K_t:
-                        # Toggle trails
-                        self.settings_manager.set("show_trails", not self.settings_manager.get("show_trails"))
-                        settings.SHOW_TRAILS = self.settings_manager.get("show_trails")
-                        print(f"Trails {'enabled' if settings.SHOW_TRAILS else 'disabled'}")
-                    elif event.key == pygame.K_c:
-                        # Clear trails and impact markers
-                        self.renderer.trails.clear()
-                        self.impact_markers.clear()
-                    elif event.key == pygame.K_m:
-                        # Toggle mute
-                        self.audio_manager.toggle_mute()
-                    elif event.key == pygame.K_PLUS or event.key == pygame.K_EQUALS:
-                        # Zoom in with keyboard
-                        self.renderer.zoom_in(self._clear_collision_markers)
-                    elif event.key == pygame.K_MINUS:
-                        # Zoom out with keyboard
-                        self.renderer.zoom_out(self._clear_collision_markers)
-                    elif event.key == pygame.K_PERIOD or event.key == pygame.K_GREATER:
-                        # Increase time scale (speed up simulation)
-                        if self.current_time_scale_index < len(self.time_scale_values) - 1:
-                            self.current_time_scale_index += 1
-                            self.time_scale = self.time_scale_values[self.current_time_scale_index]
-                            print(f"Time scale: {self.time_scale:.2f}x")
-                    elif event.key == pygame.K_COMMA or event.key == pygame.K_LESS:
-                        # Decrease time scale (slow down simulation)
-                        if self.current_time_scale_index > 0:
-                            self.current_time_scale_index -= 1
-                            self.time_scale = self.time_scale_values[self.current_time_scale_index]
-                            print(f"Time scale: {self.time_scale:.2f}x")
-                    elif event.key == pygame.K_F11:
-                        # Toggle fullscreen
-                        self.renderer.toggle_fullscreen()
-                        self.settings_manager.set("fullscreen", self.renderer.is_fullscreen)
-                    elif event.key == pygame.K_ESCAPE:
-                        # Open main menu
-                        self.menu_open = True
-                        self.menu_state = "main"
-                        self.menu_selection = 3  # Default to "Resume" (0=Scenario, 1=Settings, 2=Controls, 3=Resume)
-                        self.paused = True  # Pause simulation when menu opens
-                    elif event.key == pygame.K_q:
-                        # Q key to quit directly
-                        self.running = False
-            elif event.type == pygame.VIDEORESIZE:
-                # Handle window resize (maximize button, etc.)
-                self.renderer.handle_resize(event.w, event.h)
+        # Fetch only the event types with a handler and drop the rest unconverted
+        events = pygame.event.get(self._handled_events)
+        pygame.event.clear(pump=False)
+        if events:
+            # Any input may change what is on screen
+            self._render_dirty = True
+
+        handlers = self._event_handlers
+        for event in events:
+            handler = handlers.get(event.type)
+            if handler is not None:
+                handler(event)
+
+        if self._pending_resize is not None:
+            self.renderer.handle_resize(*self._pending_resize)
+            self._pending_resize = None
+
+        self._track_mouse()
+
+    def _on_quit(self, event) -> None:
+        """Stop the simulation when the window is closed."""
+        self.running = False
+
+    def _on_mouse_wheel(self, event) -> None:
+        """Zoom with the mouse wheel."""
+        self.renderer.handle_zoom_event(event, self._clear_collision_markers)
+
+    def _on_mouse_button_down(self, event) -> None:
+        """Start camera panning or a body/satellite drag."""
+        if event.button == 1:  # Left mouse button
+            keys = pygame.key.get_pressed()
+            if keys[pygame.K_LSHIFT] or keys[pygame.K_RSHIFT]:  # Shift + left click = camera pan
+                self.is_panning_camera = True
+                self.camera_pan_start_pos = event.pos
+                self.camera_pan_last_pos = event.pos
+            else:  # Regular left click = custom body
+                self.is_dragging_body = True
+                self.body_drag_start_pos = event.pos
+                self.body_drag_current_pos = event.pos
+        elif event.button == 3:  # Right mouse button - satellite
+            self.is_dragging_satellite = True
+            self.satellite_drag_start_pos = event.pos
+            self.satellite_drag_current_pos = event.pos
+
+    def _on_mouse_button_up(self, event) -> None:
+        """Finish camera panning or create the dragged body/satellite."""
+        if event.button == 1:  # Left mouse button release
+            if self.is_panning_camera:
+                # End camera panning
+                self.is_panning_camera = False
+                self.camera_pan_start_pos = None
+                self.camera_pan_last_pos = None
+            elif self.is_dragging_body:
+                # End dragging and create custom body with input dialog
+                self.body_drag_current_pos = event.pos
+                self._create_custom_body_from_drag()
+                self.is_dragging_body = False
+                self.body_drag_start_pos = None
+                self.body_drag_current_pos = None
+        elif event.button == 3 and self.is_dragging_satellite:  # Right mouse button release
+            # End dragging and create satellite
+            self.satellite_drag_current_pos = event.pos
+            self._create_satellite_from_drag()
+            self.is_dragging_satellite = False
+            self.satellite_drag_start_pos = None
+            self.satellite_drag_current_pos = None
+
+    def _on_key_down(self, event) -> None:
+        """Route a key press to the menu or to the game controls."""
+        if self.menu_open:
+            # Handle menu navigation based on current menu state
+            self._handle_menu_input(event.key)
+        else:
+            handler = self._key_handlers.get(event.key)
+            if handler is not None:
+                handler()
+
+    def _on_video_resize(self, event) -> None:
+        """Handle window resize (maximize button, etc.)."""
+        # Dragging a window edge can queue several resizes per frame; only the last one is applied
+        self._pending_resize = (event.w, event.h)
+
+    def _on_window_exposed(self, event) -> None:
+        """Redraw a paused frame once the window is uncovered."""
+        self._render_dirty = True
+
+    def _toggle_pause(self) -> None:
+        """Pause or resume the simulation."""
+        self.paused = not self.paused
+
+    def _reset_simulation(self) -> None:
+        """Restart the current scenario from its initial state."""
+        self._setup_bodies()  # Reset simulation
+        self.impact_markers.clear()  # Clear impact markers
+        self.renderer.clear_trails()  # Clear trails
+        self.renderer.reset_camera_and_zoom()  # Reset camera position and zoom
+        self.simulation_time_elapsed = 0.0  # Reset elapsed time
+        self.real_time_start = pygame.time.get_ticks()  # Reset real time tracker
+        self.audio_manager.play_scenario_music(self.scenario)  # Restart music
+        # Note: _setup_bodies() already resets total_satellites_created to 1
+
+    def _toggle_labels(self) -> None:
+        """Toggle body labels."""
+        self.settings_manager.set("show_labels", not self.settings_manager.get("show_labels"))
+        settings.SHOW_LABELS = self.settings_manager.get("show_labels")
+        print(f"Labels {'enabled' if settings.SHOW_LABELS else 'disabled'}")
+
+    def _toggle_trails(self) -> None:
+        """Toggle body trails."""
+        self.settings_manager.set("show_trails", not self.settings_manager.get("show_trails"))
+        settings.SHOW_TRAILS = self.settings_manager.get("show_trails")
+        print(f"Trails {'enabled' if settings.SHOW_TRAILS else 'disabled'}")
+
+    def _clear_trails_and_impacts(self) -> None:
+        """Clear trails and impact markers."""
+        self.renderer.clear_trails()
+        self.impact_markers.clear()
+
+    def _zoom_in(self) -> None:
+        """Zoom in with the keyboard."""
+        self.renderer.zoom_in(self._clear_collision_markers)
+
+    def _zoom_out(self) -> None:
+        """Zoom out with the keyboard."""
+        self.renderer.zoom_out(self._clear_collision_markers)
+
+    def _speed_up_time(self) -> None:
+        """Increase time scale (speed up simulation)."""
+        if self.current_time_scale_index < len(self.time_scale_values) - 1:
+            self.current_time_scale_index += 1
+            self.time_scale = self.time_scale_values[self.current_time_scale_index]
+            print(f"Time scale: {self.time_scale:.2f}x")
+
+    def _slow_down_time(self) -> None:
+        """Decrease time scale (slow down simulation)."""
+        if self.current_time_scale_index > 0:
+            self.current_time_scale_index -= 1
+            self.time_scale = self.time_scale_values[self.current_time_scale_index]
+            print(f"Time scale: {self.time_scale:.2f}x")
+
+    def _toggle_fullscreen(self) -> None:
+        """Toggle fullscreen and remember the choice."""
+        self.renderer.toggle_fullscreen()
+        self.settings_manager.set("fullscreen", self.renderer.is_fullscreen)
+
+    def _open_menu(self) -> None:
+        """Open the main menu and pause the simulation."""
+        self.menu_open = True
+        self.menu_state = "main"
+        self.menu_selection = 3  # Default to "Resume" (0=Scenario, 1=Settings, 2=Controls, 3=Resume)
+        self.paused = True  # Pause simulation when menu opens
+        # The scene may have changed since the menu was last open
+        self.renderer.discard_menu_backdrop()
+
+    def _close_menu(self) -> None:
+        """Close the menu, saving any settings changed while it was open."""
+        self.menu_open = False
+        # A whole menu session of adjustments costs one write, made as the menu closes
+        self.settings_manager.flush()
+
+    def _quit(self) -> None:
+        """Q key to quit directly."""
+        self.running = False
+
+    def _track_mouse(self) -> None:
+        """Sample the mouse once per frame for camera panning and drag arrows."""
+        if not (self.is_panning_camera or self.is_dragging_satellite or self.is_dragging_body):
+            return
+
+        # Panning and drag arrows follow the mouse even while paused
+        self._render_dirty = True
+        mouse_pos = pygame.mouse.get_pos()
+        if self.is_panning_camera:
+            # Calculate camera movement based on mouse delta
+            if self.camera_pan_last_pos and mouse_pos != self.camera_pan_last_pos:
+                delta_x = mouse_pos[0] - self.camera_pan_last_pos[0]
+                delta_y = mouse_pos[1] - self.camera_pan_last_pos[1]
+                # Move camera in opposite direction of mouse movement
+                self.renderer.move_camera(-delta_x, -delta_y, self._clear_collision_markers)
+            self.camera_pan_last_pos = mouse_pos
+        elif self.is_dragging_satellite:
+            self.satellite_drag_current_pos = mouse_pos
+        elif self.is_dragging_body:
+            self.body_drag_current_pos = mouse_pos
+
+    def _integrate(self, dt: float, num_steps: int) -> BodyArrays:
+        """Advance all bodies by num_steps steps of dt on structure-of-arrays state."""
+        arrays = self.body_arrays
+        if len(arrays) != len(self.bodies):
+            # The body list was replaced or edited directly; gather it again
+            arrays.load(self.bodies)
+        for _ in range(num_steps):
+            # Semi-implicit Euler: kick the velocities, then drift the positions, in one pass
+            compute_gravitational_accelerations(arrays, tree=self._gravity_tree, gpu=self._gravity_gpu)
+            arrays.kick_drift(dt)
+        arrays.store(self.bodies)
+        return arrays
+
+    def update_physics(self, dt: float) -> None:
+        """Advance the simulation by dt seconds of simulated time using the configured integration method."""
+        if settings.PHYSICS_INTEGRATION_METHOD == "multi_step":
+            # Use multiple smaller steps for better stability at high time scales
+            self.update_physics_multi_step(dt, settings.PHYSICS_DT)
+        elif settings.PHYSICS_INTEGRATION_METHOD == "single_step":
+            # Use single large step (faster but less stable at high time scales)
+            self.update_physics_single_step(dt)
+        elif settings.PHYSICS_INTEGRATION_METHOD == "patched_conic":
+            raise NotImplementedError("Patched conic integration not implemented yet")
+        else:
+            print(f"Unknown physics integration method: {settings.PHYSICS_INTEGRATION_METHOD}")
+            sys.exit(1)
 
     def update_physics_single_step(self, dt: float) -> None:
         """Update the physics simulation."""
         if not self.paused:
-            # Apply gravitational forces
-            apply_gravitational_forces(self.bodies, dt)
-
-            # Update all bodies
-            for body in self.bodies:
-                body.update(dt)
+            # Apply gravitational forces and move all bodies in one vectorized step
+            arrays = self._integrate(dt, 1)
 
             # Update simulation time
             self.simulation_time_elapsed += dt
 
             # Check for collisions
-            collisions = detect_collisions(self.bodies)
-            for colliding_body, target_body in collisions:
-                # Create impact marker at collision point
-                impact_marker = create_impact_marker(colliding_body, target_body)
-                self.impact_markers.append(impact_marker)
-
-                # Remove the colliding body
-                if colliding_body in self.bodies:
-                    self.bodies.remove(colliding_body)
-                    print(f"{colliding_body.name} crashed into {target_body.name}!")
+            self._resolve_collisions(arrays)
 
     def update_physics_multi_step(self, total_dt: float, base_dt: float) -> None:
         """Update physics using multiple smaller steps for better stability."""
         if not self.paused:
-            # Calculate how many steps we need, but cap it to prevent excessive lag
+            # Calculate how many steps keep each one at most base_dt long,
+            # but cap it to prevent excessive lag
             max_steps_per_frame = settings.MAX_PHYSICS_STEPS_PER_FRAME
-            num_steps = max(1, min(int(total_dt / base_dt), max_steps_per_frame))
+            num_steps = max(1, min(ceil(total_dt / base_dt), max_steps_per_frame))
             actual_dt = total_dt / num_steps
 
             # Run multiple physics steps
-            for _ in range(num_steps):
-                # Apply gravitational forces
-                apply_gravitational_forces(self.bodies, actual_dt)
-
-                # Update all bodies
-                for body in self.bodies:
-                    body.update(actual_dt)
-
-                # Check for collisions (only need to check once per frame, not every substep)
-                # We'll do this after all substeps are complete
+            # Check for collisions only once per frame, after all substeps are complete
+            arrays = self._integrate(actual_dt, num_steps)
 
             # Update simulation time
             self.simulation_time_elapsed += total_dt
 
             # Check for collisions after all physics steps
-            collisions = detect_collisions(self.bodies)
-            for colliding_body, target_body in collisions:
-                # Create impact marker at collision point
-                impact_marker = create_impact_marker(colliding_body, target_body)
-                self.impact_markers.append(impact_marker)
+            self._resolve_collisions(arrays)
+
+    def _resolve_collisions(self, arrays: BodyArrays) -> None:
+        """Mark impact sites and remove every body destroyed in a collision."""
+        collisions = detect_collision_indices(self.bodies, arrays, self._collision_buffers)
+        if not collisions:
+            return
+
+        bodies = self.bodies
+        survivors = [True] * len(bodies)
+        for destroyed, target in collisions:
+            colliding_body = bodies[destroyed]
+            target_body = bodies[target]
+            # Create impact marker at collision point
+            impact_marker = create_impact_marker(colliding_body, target_body)
+            self.impact_markers.append(impact_marker)
+
+            # Mark the colliding body for removal
+            if survivors[destroyed]:
+                survivors[destroyed] = False
+                print(f"{colliding_body.name} crashed into {target_body.name}!")
 
-                # Remove the colliding body
-                if colliding_body in self.bodies:
-                    self.bodies.remove(colliding_body)
-                    print(f"{colliding_body.name} crashed into {target_body.name}!")
+        # Remove all destroyed bodies in a single pass
+        self.bodies = list(compress(bodies, survivors))
+        self.body_arrays.keep(np.array(survivors, dtype=bool))
 
     def render(self) -> None:
         """Render the current frame."""
+        if self.paused and not self._render_dirty:
+            # Nothing moved since the last frame; show it again
+            self.renderer.present_cached()
+            return
+
+        # The simulation is paused behind the menu, so its dimmed scene can be reused until the view changes
+        scene_key = self._menu_scene_key() if self.menu_open else None
+        if scene_key is None or not self.renderer.draw_menu_backdrop(scene_key):
+            self._draw_scene()
+            if scene_key is not None:
+                self.renderer.save_menu_backdrop(scene_key)
+
+        # Draw scenario menu (if open)
+        self._draw_scenario_menu()
+
+        self.renderer.present()
+        self._render_dirty = False
+
+    def _draw_scene(self) -> None:
+        """Draw the starfield, bodies, trails, markers, drag arrows, info text and HUD."""
         self.renderer.clear_screen()
 
         # Draw all celestial bodies
-        for body in self.bodies:
-            self.renderer.draw_body(body)
+        self.renderer.draw_bodies(self.bodies)
+        self.renderer.draw_trails()
 
         # Draw impact markers
-        for marker in self.impact_markers:
-            self.renderer.draw_impact_marker(marker)
+        self.renderer.draw_impact_markers(self.impact_markers)
 
         # Draw velocity arrows if dragging
         if self.is_dragging_satellite and self.satellite_drag_start_pos and self.satellite_drag_current_pos:
@@ -783,63 +920,55 @@ class SolarSystemSimulation:
         # Draw information
         self.renderer.draw_info(self.bodies)
 
-        # Draw zoom level
-        self._draw_zoom_info()
+        # Draw zoom, time scale, elapsed time, status and instructions
+        self._draw_hud()
 
-        # Draw time scale
-        self._draw_time_scale_info()
+    def _menu_scene_key(self) -> tuple:
+        """Everything the scene drawn behind the menu depends on while the simulation is paused."""
+        renderer = self.renderer
+        return (renderer.width, renderer.height, renderer.zoom, renderer.camera_offset_x,
+                renderer.camera_offset_y, settings.SHOW_LABELS, settings.SHOW_TRAILS, len(self.bodies),
+                len(self.impact_markers), self.satellite_drag_current_pos, self.body_drag_current_pos,
+                self.time_scale, self.simulation_time_elapsed, self.paused)
 
-        # Draw elapsed time
-        self._draw_elapsed_time_info()
-
-        # Draw simulation status
-        self._draw_simulation_status()
-
-        # Draw instructions
-        self._draw_instructions()
-
-        # Draw scenario menu (if open)
-        self._draw_scenario_menu()
-
-        self.renderer.present()
-
-    def _draw_instructions(self) -> None:
-        """Draw simplified control instructions on screen."""
-        font = self.renderer.get_font('red_alert_small')
+    def _build_instruction_surface(self) -> pygame.Surface:
+        """Render the control instructions once; the text never changes."""
         instruction_text = "ESC: Menu"
+        return self._hud_font.render(instruction_text, True, (255, 255, 255)).convert_alpha()
+
+    def _draw_hud(self) -> None:
+        """Draw the on-screen text in a single batched blit."""
+        # Info lines stacked in the top-right corner, 30 pixels apart
+        info_surfaces = (
+            self._render_zoom_info(),
+            self._render_time_scale_info(),
+            self._render_elapsed_time_info(),
+            self._render_simulation_status(),
+        )
+        right = self.renderer.width - 10
+        blits = [(surface, (right - surface.get_width(), 10 + 30 * i))
+                 for i, surface in enumerate(info_surfaces)]
 
-        text_surface = font.render(instruction_text, True, (255, 255, 255))
-        # Position in bottom-left corner with some margin
-        self.renderer.screen.blit(text_surface, (10, self.renderer.height - 30))
+        # Instructions in the bottom-left corner with some margin
+        blits.append((self._instructions_surface, (10, self.renderer.height - 30)))
+        self.renderer.screen.blits(blits, doreturn=False)
 
-    def _draw_zoom_info(self) -> None:
-        """Draw current zoom level."""
-        font = self.renderer.get_font('red_alert_small')
+    def _render_zoom_info(self) -> pygame.Surface:
+        """Render the current zoom level."""
         zoom_text = f"Zoom: {self.renderer.zoom:.1f}x"
-        text_surface = font.render(zoom_text, True, (255, 255, 255))
-
-        # Position in top-right corner
-        x_pos = self.renderer.width - text_surface.get_width() - 10
-        self.renderer.screen.blit(text_surface, (x_pos, 10))
+        return self._render_hud_text("zoom", zoom_text)
 
-    def _draw_time_scale_info(self) -> None:
-        """Draw current time scale."""
-        font = self.renderer.get_font('red_alert_small')
+    def _render_time_scale_info(self) -> pygame.Surface:
+        """Render the current time scale."""
         # Format time scale display nicely
         if self.time_scale < 1:
             time_text = f"Time: {self.time_scale:.2f}x"
         else:
             time_text = f"Time: {self.time_scale:.0f}x"
-        text_surface = font.render(time_text, True, (255, 255, 255))
-
-        # Position in top-right corner, below zoom info
-        x_pos = self.renderer.width - text_surface.get_width() - 10
-        self.renderer.screen.blit(text_surface, (x_pos, 40))
-
-    def _draw_elapsed_time_info(self) -> None:
-        """Draw elapsed simulation time."""
-        font = self.renderer.get_font('red_alert_small')
+        return self._render_hud_text("time_scale", time_text)
 
+    def _render_elapsed_time_info(self) -> pygame.Surface:
+        """Render the elapsed simulation time."""
         # Convert seconds to a more readable format
         total_seconds = int(self.simulation_time_elapsed)
 
@@ -865,16 +994,10 @@ class SolarSystemSimulation:
         else:
             time_text = f"Elapsed: {seconds}s"
 
-        text_surface = font.render(time_text, True, (255, 255, 255))
-
-        # Position in top-right corner, below time scale info
-        x_pos = self.renderer.width - text_surface.get_width() - 10
-        self.renderer.screen.blit(text_surface, (x_pos, 70))
-
-    def _draw_simulation_status(self) -> None:
-        """Draw simulation status (playing/paused)."""
-        font = self.renderer.get_font('red_alert_small')
+        return self._render_hud_text("elapsed", time_text)
 
+    def _render_simulation_status(self) -> pygame.Surface:
+        """Render the simulation status (playing/paused)."""
         if self.paused:
             status_text = "PAUSED"
             color = (255, 100, 100)  # Red-ish for paused
@@ -882,11 +1005,17 @@ class SolarSystemSimulation:
             status_text = "PLAYING"
             color = (100, 255, 100)  # Green-ish for playing
 
-        text_surface = font.render(status_text, True, color)
+        return self._render_hud_text("status", status_text, color)
 
-        # Position in top-right corner, below elapsed time info
-        x_pos = self.renderer.width - text_surface.get_width() - 10
-        self.renderer.screen.blit(text_surface, (x_pos, 100))
+    def _render_hud_text(self, line: str, text: str,
+                         color: Tuple[int, int, int] = (255, 255, 255)) -> pygame.Surface:
+        """Render a HUD line, reusing the previous surface while its text is unchanged."""
+        cached = self._hud_text_cache.get(line)
+        if cached is not None and cached[0] == text:
+            return cached[1]
+        surface = self._hud_font.render(text, True, color)
+        self._hud_text_cache[line] = (text, surface)
+        return surface
 
     def _draw_scenario_menu(self) -> None:
         """Draw the menu system."""
@@ -917,7 +1046,8 @@ class SolarSystemSimulation:
             self.menu_selection,
             options,
             self.settings_manager,
-            self.audio_manager
+            self.audio_manager,
+            dim_scene=False  # Dimmed by the menu backdrop
         )
 
     def run(self) -> None:
@@ -950,25 +1080,26 @@ class SolarSystemSimulation:
         print("  ,/.: Time scale slower/faster")
         print("  F11: Toggle fullscreen")
 
+        # Physics runs at a fixed rate in real time; rendering happens once per frame
+        update_interval = 1.0 / settings.PHYSICS_UPDATE_RATE
+        accumulator = 0.0
+
         while self.running:
             self.handle_events()
 
-            # Choose physics integration method based on settings
-            if settings.PHYSICS_INTEGRATION_METHOD == "multi_step":
-                # Use multiple smaller steps for better stability at high time scales
-                total_dt = PHYSICS_DT * self.time_scale
-                self.update_physics_multi_step(total_dt, PHYSICS_DT)
-            elif settings.PHYSICS_INTEGRATION_METHOD == "single_step":
-                # Use single large step (faster but less stable at high time scales)
-                self.update_physics_single_step(PHYSICS_DT * self.time_scale)
-            elif settings.PHYSICS_INTEGRATION_METHOD == "patched_conic":
-                raise NotImplementedError("Patched conic integration not implemented yet")
-            else:
-                print(f"Unknown physics integration method: {settings.PHYSICS_INTEGRATION_METHOD}")
-                sys.exit(1)
+            # Simulated time per update, fixed for the frame once input has changed the time scale
+            dt_fixed = settings.PHYSICS_DT * self.time_scale
+
+            # Catch up on the real time that passed during the last frame, in fixed updates
+            accumulator += min(self.renderer.clock.get_time() / 1000.0, settings.MAX_FRAME_TIME)
+            while accumulator >= update_interval:
+                self.update_physics(dt_fixed)
+                accumulator -= update_interval
 
             self.render()
 
+        # Save what no menu close wrote, such as keyboard toggles or changes before quitting from the menu
+        self.settings_manager.flush()
         self.audio_manager.cleanup()
         self.renderer.quit()
         print("Simulation ended.")
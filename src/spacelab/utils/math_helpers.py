@@ -3,15 +3,19 @@
 import math
 from typing import Tuple
 
+# Angle conversion factors, folded once at import
+_DEG = math.pi / 180.0
+_RAD = 180.0 / math.pi
+
 
 def magnitude(x: float, y: float) -> float:
     """Calculate the magnitude of a 2D vector."""
-    return math.sqrt(x**2 + y**2)
+    return math.hypot(x, y)
 
 
 def normalize(x: float, y: float) -> Tuple[float, float]:
     """Normalize a 2D vector to unit length."""
-    mag = magnitude(x, y)
+    mag = math.hypot(x, y)
     if mag == 0:
         return (0.0, 0.0)
     return (x / mag, y / mag)
@@ -19,14 +23,14 @@ def normalize(x: float, y: float) -> Tuple[float, float]:
 
 def distance(x1: float, y1: float, x2: float, y2: float) -> float:
     """Calculate distance between two points."""
-    return magnitude(x2 - x1, y2 - y1)
+    return math.hypot(x2 - x1, y2 - y1)
 
 
 def degrees_to_radians(degrees: float) -> float:
     """Convert degrees to radians."""
-    return degrees * math.pi / 180.0
+    return degrees * _DEG
 
 
 def radians_to_degrees(radians: float) -> float:
     """Convert radians to degrees."""
-    return radians * 180.0 / math.pi
+    return radians * _RAD